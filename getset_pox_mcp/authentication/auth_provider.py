@@ -13,7 +13,7 @@ Security Features:
 
 from typing import Optional, Dict, Any, List
 import asyncio
-import msal
+import logging
 from getset_pox_mcp.authentication.auth_config import AuthConfig
 from getset_pox_mcp.authentication.token_manager import TokenManager
 from getset_pox_mcp.logging_config import get_logger
@@ -49,12 +49,29 @@ class EntraIDAuthProvider:
         """
         self.config = config
         self.token_manager = TokenManager(cache_path=config.token_cache_path)
-        self._msal_app: Optional[msal.ConfidentialClientApplication] = None
+        # Frozen copy of scopes so MSAL doesn't hash a fresh list per call
+        self._scopes = tuple(config.scopes)
+        # msal.ConfidentialClientApplication or msal.PublicClientApplication;
+        # typed as Any because msal is imported lazily
+        self._msal_app: Optional[Any] = None
         
         # Initialize MSAL application if auth is enabled
         if config.enable_auth:
             self._initialize_msal_app()
-        
+
+        # Resolve the auth_mode branch once at construction time so the
+        # per-call paths dispatch through a bound method instead of
+        # re-comparing the mode string
+        self._delegated = config.auth_mode == "delegated"
+        # Serializes refresh/acquire so concurrent callers that all see an
+        # expired token trigger a single network round-trip
+        self._refresh_lock = asyncio.Lock()
+        self._acquire_impl = (
+            self._acquire_token_for_user
+            if self._delegated
+            else self._acquire_token_for_application
+        )
+
         logger.info(f"EntraIDAuthProvider initialized (mode={config.auth_mode})")
     
     def _initialize_msal_app(self) -> None:
@@ -64,6 +81,11 @@ class EntraIDAuthProvider:
         Raises:
             ValueError: If configuration is invalid
         """
+        # Imported here rather than at module scope: MSAL drags in
+        # cryptography/requests/jwt, which is wasted cold-start cost when
+        # auth is disabled. sys.modules caching makes repeat calls cheap.
+        import msal
+
         try:
             if self.config.auth_mode == "application":
                 # Confidential client for application/daemon authentication
@@ -101,29 +123,38 @@ class EntraIDAuthProvider:
             3. Acquire new token if needed
         """
         if not self.config.enable_auth:
-            logger.debug("Authentication is disabled")
             return None
-        
+
         # Return cached token if valid and not forcing refresh
         if not force_refresh:
-            # Run token_manager call in thread pool to avoid blocking on threading.Lock()
-            cached_token = await asyncio.to_thread(self.token_manager.get_access_token)
+            # In-memory peek avoids the ~100µs asyncio.to_thread dispatch
+            # on the common cached-token path
+            cached_token = self.token_manager.peek_access_token()
             if cached_token:
-                logger.debug("Using cached access token")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Using cached access token")
                 return cached_token
-        
-        # Try to refresh token
-        # Run token_manager call in thread pool to avoid blocking on threading.Lock()
-        refresh_token = await asyncio.to_thread(self.token_manager.get_refresh_token)
-        if refresh_token:
-            logger.info("Attempting to refresh access token")
-            token = await self._refresh_token()
-            if token:
-                return token
-        
-        # Acquire new token
-        logger.info("Acquiring new access token")
-        return await self._acquire_token()
+
+        async with self._refresh_lock:
+            # Double-check under the lock: whoever held it before us has
+            # likely refreshed already, so waiters return the fresh token
+            # instead of each issuing their own round-trip
+            if not force_refresh:
+                cached_token = self.token_manager.peek_access_token()
+                if cached_token:
+                    return cached_token
+
+            # Try to refresh token (lock-free snapshot read)
+            refresh_token = self.token_manager.get_refresh_token()
+            if refresh_token:
+                logger.info("Attempting to refresh access token")
+                token = await self._refresh_token()
+                if token:
+                    return token
+
+            # Acquire new token
+            logger.info("Acquiring new access token")
+            return await self._acquire_token()
     
     async def _acquire_token(self) -> Optional[str]:
         """
@@ -131,15 +162,12 @@ class EntraIDAuthProvider:
         
         Returns:
             Access token string, or None if acquisition fails
+
+        Note:
+            Error handling lives in the mode-specific implementations,
+            which already catch and log their own failures.
         """
-        try:
-            if self.config.auth_mode == "application":
-                return await self._acquire_token_for_application()
-            else:
-                return await self._acquire_token_for_user()
-        except Exception as e:
-            logger.error(f"Token acquisition failed: {e}")
-            return None
+        return await self._acquire_impl()
     
     async def _acquire_token_for_application(self) -> Optional[str]:
         """
@@ -156,17 +184,18 @@ class EntraIDAuthProvider:
             # Run synchronous MSAL call in thread pool to avoid blocking
             result = await asyncio.to_thread(
                 self._msal_app.acquire_token_for_client,
-                scopes=self.config.scopes
+                scopes=self._scopes
             )
-            
-            if "access_token" in result:
+
+            access_token = result.get("access_token")
+            if access_token:
                 # Store tokens
                 self.token_manager.store_tokens(
-                    access_token=result["access_token"],
+                    access_token=access_token,
                     expires_in=result.get("expires_in", 3600)
                 )
                 logger.info("Application token acquired successfully")
-                return result["access_token"]
+                return access_token
             else:
                 error = result.get("error")
                 error_desc = result.get("error_description")
@@ -195,7 +224,7 @@ class EntraIDAuthProvider:
             # Initiate device code flow (run in thread pool)
             flow = await asyncio.to_thread(
                 self._msal_app.initiate_device_flow,
-                scopes=self.config.scopes
+                scopes=self._scopes
             )
             
             if "user_code" not in flow:
@@ -213,15 +242,16 @@ class EntraIDAuthProvider:
                 flow
             )
             
-            if "access_token" in result:
+            access_token = result.get("access_token")
+            if access_token:
                 # Store tokens including refresh token
                 self.token_manager.store_tokens(
-                    access_token=result["access_token"],
+                    access_token=access_token,
                     refresh_token=result.get("refresh_token"),
                     expires_in=result.get("expires_in", 3600)
                 )
                 logger.info("User token acquired successfully")
-                return result["access_token"]
+                return access_token
             else:
                 error = result.get("error")
                 error_desc = result.get("error_description")
@@ -242,12 +272,12 @@ class EntraIDAuthProvider:
         Note:
             Only applicable for delegated authentication mode.
         """
-        if self.config.auth_mode != "delegated":
+        if not self._delegated:
             logger.debug("Token refresh not applicable for application mode")
             return None
         
-        # Run token_manager call in thread pool to avoid blocking on threading.Lock()
-        refresh_token = await asyncio.to_thread(self.token_manager.get_refresh_token)
+        # Lock-free snapshot read
+        refresh_token = self.token_manager.get_refresh_token()
         if not refresh_token:
             logger.debug("No refresh token available")
             return None
@@ -261,18 +291,19 @@ class EntraIDAuthProvider:
             result = await asyncio.to_thread(
                 self._msal_app.acquire_token_by_refresh_token,
                 refresh_token=refresh_token,
-                scopes=self.config.scopes
+                scopes=self._scopes
             )
-            
-            if "access_token" in result:
+
+            access_token = result.get("access_token")
+            if access_token:
                 # Store refreshed tokens
                 self.token_manager.store_tokens(
-                    access_token=result["access_token"],
+                    access_token=access_token,
                     refresh_token=result.get("refresh_token", refresh_token),
                     expires_in=result.get("expires_in", 3600)
                 )
                 logger.info("Token refreshed successfully")
-                return result["access_token"]
+                return access_token
             else:
                 error = result.get("error")
                 logger.warning(f"Token refresh failed: {error}")
@@ -326,16 +357,13 @@ class EntraIDAuthProvider:
             This is a basic validation. For production, implement
             full JWT validation with signature verification.
         """
-        if not token:
-            return False
-        
         # Basic checks
-        if len(token) < 10:
+        if not token or len(token) < 10:
             return False
-        
-        # Token should be a JWT (has 3 parts separated by dots)
-        parts = token.split(".")
-        if len(parts) != 3:
+
+        # Token should be a JWT (3 parts => exactly 2 dots); count() avoids
+        # the list and substring allocations of split()
+        if token.count(".") != 2:
             logger.warning("Token format invalid (not a JWT)")
             return False
         
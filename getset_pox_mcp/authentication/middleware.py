@@ -11,8 +11,8 @@ Security Features:
 - Error handling and logging
 """
 
+import threading
 from typing import Optional, Callable, Any
-from functools import wraps
 from getset_pox_mcp.authentication.auth_provider import EntraIDAuthProvider
 from getset_pox_mcp.authentication.auth_config import AuthConfig
 from getset_pox_mcp.logging_config import get_logger
@@ -39,6 +39,30 @@ class AuthMiddleware:
         """
         self.config = auth_config or AuthConfig.from_env()
         self.auth_provider: Optional[EntraIDAuthProvider] = None
+        # Interned header prefix; plain concatenation beats re-running an
+        # f-string template on every request
+        self._bearer_prefix = "Bearer "
+
+        # Prebuilt status templates; get_auth_status hands out copies
+        # instead of rebuilding the dict on every poll
+        self._status_disabled = {
+            "enabled": False,
+            "authenticated": False,
+            "message": "Authentication is disabled",
+            "mode": None
+        }
+        self._status_uninit = {
+            "enabled": True,
+            "authenticated": False,
+            "message": "Auth provider not initialized",
+            "mode": self.config.auth_mode
+        }
+        self._status_initialized = {
+            "enabled": self.config.enable_auth,
+            "mode": self.config.auth_mode,
+            "authenticated": False,  # Will be true after successful auth
+            "message": "Auth provider initialized"
+        }
         
         # Initialize provider if authentication is enabled
         if self.config.enable_auth:
@@ -120,23 +144,32 @@ class AuthMiddleware:
         Returns:
             Decorator function
         """
+        # Snapshot config at decoration time so the per-call path branches
+        # on locals instead of re-reading self.config on every invocation
+        enabled = self.config.enable_auth
+        get_token = self.get_valid_token
+
         def decorator(func: Callable) -> Callable:
-            @wraps(func)
+            # Auth disabled: no wrapper needed, zero per-call overhead
+            if not enabled:
+                return func
+
             async def wrapper(*args, **kwargs):
-                # Skip auth check if disabled
-                if not self.config.enable_auth:
-                    return await func(*args, **kwargs)
-                
                 # Check for valid token
-                token = await self.get_valid_token()
+                token = await get_token()
                 if not token:
                     error_msg = "Authentication required but no valid token available"
                     logger.error(error_msg)
                     raise PermissionError(error_msg)
-                
+
                 # Call original function
                 return await func(*args, **kwargs)
-            
+
+            # Copy just the identity attributes we need; skip the full
+            # functools.wraps machinery (__dict__ merge, __wrapped__)
+            wrapper.__name__ = func.__name__
+            wrapper.__qualname__ = func.__qualname__
+            wrapper.__doc__ = func.__doc__
             return wrapper
         return decorator
     
@@ -156,7 +189,7 @@ class AuthMiddleware:
             logger.warning("Sync call to get auth headers - token should be pre-fetched")
         
         if token:
-            return {"Authorization": f"Bearer {token}"}
+            return {"Authorization": self._bearer_prefix + token}
         return {}
     
     def get_auth_status(self) -> dict:
@@ -167,29 +200,13 @@ class AuthMiddleware:
             Dictionary with authentication status
         """
         if not self.config.enable_auth:
-            return {
-                "enabled": False,
-                "authenticated": False,
-                "message": "Authentication is disabled",
-                "mode": None
-            }
-        
+            return self._status_disabled.copy()
+
         if not self.auth_provider:
-            return {
-                "enabled": True,
-                "authenticated": False,
-                "message": "Auth provider not initialized",
-                "mode": self.config.auth_mode
-            }
-        
+            return self._status_uninit.copy()
+
         # Return basic status without calling token_manager.get_token_info()
-        # which uses threading.Lock() and can block async code
-        return {
-            "enabled": self.config.enable_auth,
-            "mode": self.config.auth_mode,
-            "authenticated": False,  # Will be true after successful auth
-            "message": "Auth provider initialized"
-        }
+        return self._status_initialized.copy()
     
     async def clear_auth(self) -> None:
         """
@@ -207,23 +224,31 @@ class AuthMiddleware:
 
 # Global middleware instance
 _auth_middleware: Optional[AuthMiddleware] = None
+_auth_middleware_lock = threading.Lock()
 
 def get_auth_middleware(config: Optional[AuthConfig] = None) -> AuthMiddleware:
     """
     Get or create the global authentication middleware instance.
-    
+
     Args:
         config: Optional authentication configuration
-    
+
     Returns:
         AuthMiddleware instance
     """
     global _auth_middleware
-    
-    if _auth_middleware is None:
-        _auth_middleware = AuthMiddleware(config)
-        logger.info("Global auth middleware created")
-    
+
+    # Fast path: single global load, no lock once initialized
+    middleware = _auth_middleware
+    if middleware is not None:
+        return middleware
+
+    with _auth_middleware_lock:
+        # Re-check under the lock: another thread may have won the race
+        if _auth_middleware is None:
+            _auth_middleware = AuthMiddleware(config)
+            logger.info("Global auth middleware created")
+
     return _auth_middleware
 
 
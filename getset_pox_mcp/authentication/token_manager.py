@@ -11,13 +11,40 @@ Security Features:
 """
 
 import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta, timezone
+import os
+import time
+from typing import NamedTuple, Optional, Dict, Any
+from datetime import datetime, timezone
 from pathlib import Path
 from getset_pox_mcp.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# orjson (Rust) emits the whole payload as bytes in one shot; fall back
+# to stdlib json when the optional dependency is not installed
+try:
+    import orjson
+
+    def _cache_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _cache_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+class _TokenSnapshot(NamedTuple):
+    """Immutable view of the token state, swapped atomically on update."""
+
+    access_token: Optional[str]
+    refresh_token: Optional[str]
+    expiry: Optional[datetime]
+    # Unix-timestamp mirror of expiry; the hot expiry check compares raw
+    # floats instead of allocating datetime/timedelta objects
+    expiry_ts: Optional[float]
+
+
+_EMPTY_SNAPSHOT = _TokenSnapshot(None, None, None, None)
+
 class TokenManager:
     """
     Manages access tokens and refresh tokens for EntraID authentication.
@@ -25,19 +52,25 @@ class TokenManager:
     Features:
         - Token caching to disk (optional)
         - Automatic token refresh before expiry
-        - Concurrency safe when called via asyncio.to_thread()
+        - Lock-free reads via immutable snapshot swaps
         - Token validation
-    
+
     Security Considerations:
         - Tokens are sensitive data - handle with care
         - Use secure file permissions for token cache
         - Clear tokens on logout/error
         - Never log token values
-    
+
     Note:
-        Methods should be called via asyncio.to_thread() from async code
-        to ensure thread safety without blocking the event loop.
+        Token state is held in a single immutable _TokenSnapshot; readers
+        load the reference once (atomic under the GIL) and writers swap in
+        a new snapshot, so read methods are safe to call directly from
+        async code without asyncio.to_thread().
     """
+
+    # How long a successful validity check stays good for; repeated reads
+    # within this window skip the expiry math entirely
+    _VALIDATION_TTL = 1.0
     
     def __init__(self, cache_path: Optional[str] = None):
         """
@@ -47,12 +80,13 @@ class TokenManager:
             cache_path: Optional path to token cache file
         """
         self.cache_path = Path(cache_path) if cache_path else None
-        self._access_token: Optional[str] = None
-        self._refresh_token: Optional[str] = None
-        self._token_expiry: Optional[datetime] = None
-        
-        # Load cached tokens if available
-        if self.cache_path and self.cache_path.exists():
+        self._tokens: _TokenSnapshot = _EMPTY_SNAPSHOT
+        self._last_valid_check_ts: float = 0.0
+        self._last_cache_payload: Optional[bytes] = None
+
+        # Load cached tokens if available (missing file handled inline,
+        # avoiding a separate stat in the common "no cache yet" case)
+        if self.cache_path:
             self._load_from_cache()
         
         logger.info(f"TokenManager initialized (cache={'enabled' if cache_path else 'disabled'})")
@@ -71,16 +105,26 @@ class TokenManager:
             refresh_token: The refresh token (optional)
             expires_in: Token lifetime in seconds (default 3600)
         """
-        self._access_token = access_token
-        self._refresh_token = refresh_token
-        self._token_expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-        
+        # Build the new snapshot first, then publish it with a single
+        # reference swap so readers never observe a partial update
+        expiry_ts = time.time() + expires_in
+        snapshot = _TokenSnapshot(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            # Derive the datetime view from the float so both fields agree
+            # and no timedelta is ever constructed
+            expiry=datetime.fromtimestamp(expiry_ts, timezone.utc),
+            expiry_ts=expiry_ts,
+        )
+        self._tokens = snapshot
+        self._last_valid_check_ts = 0.0
+
         # Save to cache if enabled
         if self.cache_path:
             self._save_to_cache()
-        
+
         logger.info(
-            f"Tokens stored (expires at {self._token_expiry.isoformat()})"
+            f"Tokens stored (expires at {snapshot.expiry.isoformat()})"
         )
     
     def get_access_token(self) -> Optional[str]:
@@ -90,16 +134,42 @@ class TokenManager:
         Returns:
             Access token if available and not expired, None otherwise
         """
-        if not self._access_token:
+        snapshot = self._tokens
+        if not snapshot.access_token:
             logger.debug("No access token available")
             return None
-        
+
+        # Recently verified valid: skip the expiry math
+        if time.monotonic() - self._last_valid_check_ts < self._VALIDATION_TTL:
+            return snapshot.access_token
+
         if self.is_token_expired():
             logger.warning("Access token is expired")
             return None
-        
-        return self._access_token
+
+        self._last_valid_check_ts = time.monotonic()
+        return snapshot.access_token
     
+    def peek_access_token(self) -> Optional[str]:
+        """
+        Fast-path read of the current access token without a thread hop.
+
+        Reads a single immutable snapshot reference (atomic under the
+        GIL), so it is safe to call directly from async code without
+        dispatching through asyncio.to_thread().
+
+        Returns:
+            Access token if available and not expired, None otherwise
+        """
+        snapshot = self._tokens
+        if not snapshot.access_token:
+            return None
+
+        if self.is_token_expired():
+            return None
+
+        return snapshot.access_token
+
     def get_refresh_token(self) -> Optional[str]:
         """
         Get the refresh token.
@@ -107,7 +177,7 @@ class TokenManager:
         Returns:
             Refresh token if available, None otherwise
         """
-        return self._refresh_token
+        return self._tokens.refresh_token
     
     def is_token_expired(self, buffer_seconds: int = 300) -> bool:
         """
@@ -119,20 +189,10 @@ class TokenManager:
         Returns:
             True if token is expired or expiring soon, False otherwise
         """
-        if not self._token_expiry:
-            return True
-        
-        # Check if token expires within buffer time
-        expiry_threshold = datetime.now(timezone.utc) + timedelta(seconds=buffer_seconds)
-        is_expired = self._token_expiry <= expiry_threshold
-        
-        if is_expired:
-            logger.debug(
-                f"Token expired or expiring soon "
-                f"(expiry: {self._token_expiry.isoformat()})"
-            )
-        
-        return is_expired
+        # Raw float compare; no datetime/timedelta allocations on what is
+        # the hottest check in the auth path
+        expiry_ts = self._tokens.expiry_ts
+        return expiry_ts is None or expiry_ts <= time.time() + buffer_seconds
     
     def clear_tokens(self) -> None:
         """
@@ -143,14 +203,15 @@ class TokenManager:
         - Authentication error occurs
         - Switching accounts
         """
-        self._access_token = None
-        self._refresh_token = None
-        self._token_expiry = None
-        
-        # Remove cache file if it exists
-        if self.cache_path and self.cache_path.exists():
+        self._tokens = _EMPTY_SNAPSHOT
+        self._last_valid_check_ts = 0.0
+
+        # Remove cache file; missing_ok folds the exists+unlink pair into
+        # one syscall and avoids the check-then-delete race
+        if self.cache_path:
             try:
-                self.cache_path.unlink()
+                self.cache_path.unlink(missing_ok=True)
+                self._last_cache_payload = None
                 logger.info("Token cache cleared")
             except Exception as e:
                 logger.error(f"Failed to clear token cache: {e}")
@@ -167,30 +228,39 @@ class TokenManager:
             return
         
         try:
+            snapshot = self._tokens
             cache_data = {
-                "access_token": self._access_token,
-                "refresh_token": self._refresh_token,
-                "expiry": self._token_expiry.isoformat() if self._token_expiry else None,
+                "access_token": snapshot.access_token,
+                "refresh_token": snapshot.refresh_token,
+                # Raw epoch float: the JSON decoder turns it straight back
+                # into a float on load, no ISO-string parsing
+                "expiry_ts": snapshot.expiry_ts,
             }
-            
+
+            # Serialize once; skip the disk write entirely when nothing
+            # changed (common when store_tokens re-stores the same token)
+            payload = _cache_dumps(cache_data)
+            if payload == self._last_cache_payload:
+                return
+
             # Ensure parent directory exists
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write cache file
-            with open(self.cache_path, "w") as f:
-                json.dump(cache_data, f)
-            
-            # Set restrictive permissions (user read/write only)
-            # Windows: This is a simplified approach; use proper ACLs in production
+
+            # Write to a sibling temp file opened with user-only
+            # permissions (fuses the chmod into the open), then publish it
+            # atomically with os.replace so readers never see a torn file
+            # Windows: 0o600 is advisory; use proper ACLs in production
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
             try:
-                import stat
-                self.cache_path.chmod(stat.S_IRUSR | stat.S_IWUSR)
-            except Exception:
-                # chmod may not work on Windows, log but continue
-                pass
-            
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self.cache_path)
+            self._last_cache_payload = payload
+
             logger.debug(f"Tokens saved to cache: {self.cache_path}")
-            
+
         except Exception as e:
             logger.error(f"Failed to save token cache: {e}")
     
@@ -200,20 +270,38 @@ class TokenManager:
         
         Security: Validate cache file permissions before loading
         """
-        if not self.cache_path or not self.cache_path.exists():
+        if not self.cache_path:
             return
-        
+
         try:
             with open(self.cache_path, "r") as f:
                 cache_data = json.load(f)
-            
-            self._access_token = cache_data.get("access_token")
-            self._refresh_token = cache_data.get("refresh_token")
-            
-            expiry_str = cache_data.get("expiry")
-            if expiry_str:
-                self._token_expiry = datetime.fromisoformat(expiry_str)
-            
+
+        except FileNotFoundError:
+            # No cache yet — nothing to load
+            return
+        except Exception as e:
+            logger.error(f"Failed to load token cache: {e}")
+            # Clear potentially corrupted cache
+            self.clear_tokens()
+            return
+
+        try:
+            expiry_ts = cache_data.get("expiry_ts")
+            if expiry_ts is not None:
+                expiry = datetime.fromtimestamp(expiry_ts, timezone.utc)
+            else:
+                # Legacy cache files stored an ISO string under "expiry"
+                expiry_str = cache_data.get("expiry")
+                expiry = datetime.fromisoformat(expiry_str) if expiry_str else None
+                expiry_ts = expiry.timestamp() if expiry else None
+            self._tokens = _TokenSnapshot(
+                access_token=cache_data.get("access_token"),
+                refresh_token=cache_data.get("refresh_token"),
+                expiry=expiry,
+                expiry_ts=expiry_ts,
+            )
+
             # Check if cached token is already expired
             if self.is_token_expired(buffer_seconds=0):
                 logger.info("Cached token is expired, clearing cache")
@@ -233,10 +321,17 @@ class TokenManager:
         Returns:
             Dictionary with token status information (no sensitive data)
         """
+        snapshot = self._tokens
+        # Reuse the validity memo so monitoring scrapes don't redo the
+        # expiry math a hot read just performed
+        if time.monotonic() - self._last_valid_check_ts < self._VALIDATION_TTL:
+            is_expired = False
+        else:
+            is_expired = self.is_token_expired()
         return {
-            "has_access_token": self._access_token is not None,
-            "has_refresh_token": self._refresh_token is not None,
-            "is_expired": self.is_token_expired(),
-            "expiry": self._token_expiry.isoformat() if self._token_expiry else None,
+            "has_access_token": snapshot.access_token is not None,
+            "has_refresh_token": snapshot.refresh_token is not None,
+            "is_expired": is_expired,
+            "expiry": snapshot.expiry.isoformat() if snapshot.expiry else None,
             "cache_enabled": self.cache_path is not None,
         }
@@ -35,18 +35,26 @@ class ServerConfig:
         Returns:
             ServerConfig instance populated from environment variables.
         """
-        transport = os.getenv("TRANSPORT", "stdio").lower()
+        # Bind os.environ once; .lower()/.upper() only run when the
+        # variable is actually set, since the defaults are already cased
+        env = os.environ
+
+        transport = env.get("TRANSPORT")
+        transport = transport.lower() if transport else "stdio"
         if transport not in ("stdio", "http"):
             raise ValueError(f"Invalid transport mode: {transport}. Must be 'stdio' or 'http'.")
-        
+
+        log_level = env.get("LOG_LEVEL")
+        log_level = log_level.upper() if log_level else "INFO"
+
         return cls(
             transport=transport,  # type: ignore
-            http_host=os.getenv("HTTP_HOST", "127.0.0.1"),
-            http_port=int(os.getenv("HTTP_PORT", "3000")),
-            http_path=os.getenv("HTTP_PATH", "/mcp"),
-            stateless_http=os.getenv("STATELESS_HTTP", "false").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
-            log_file=os.getenv("LOG_FILE"),
+            http_host=env.get("HTTP_HOST", "127.0.0.1"),
+            http_port=int(env.get("HTTP_PORT", "3000")),
+            http_path=env.get("HTTP_PATH", "/mcp"),
+            stateless_http=env.get("STATELESS_HTTP", "").lower() == "true",
+            log_level=log_level,
+            log_file=env.get("LOG_FILE"),
         )
     
     def validate(self) -> None:
@@ -5,7 +5,9 @@ This module sets up structured logging with appropriate formatters
 and handlers based on the server configuration.
 """
 
+import atexit
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
@@ -46,10 +48,30 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        # Rotating handler with delay=True defers the open() until the
+        # first record actually reaches the file
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=10_000_000,
+            backupCount=3,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setLevel(getattr(logging, log_level))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # Batch records in memory so ~100 log calls cost one write syscall
+        # instead of a write+flush each; errors flush immediately
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=100,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        memory_handler.setLevel(getattr(logging, log_level))
+        logger.addHandler(memory_handler)
+
+        # Make sure buffered records hit disk on interpreter shutdown
+        atexit.register(memory_handler.flush)
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -6,6 +6,8 @@ transport layer handling (STDIO and HTTP).
 """
 
 import asyncio
+import logging
+import sys
 from typing import Any
 
 from mcp.server import Server
@@ -14,134 +16,208 @@ from mcp.types import Tool, TextContent
 
 from getset_pox_mcp.config import ServerConfig
 from getset_pox_mcp.logging_config import setup_logging, get_logger
-from getset_pox_mcp.services import (
-    hello_world, echo, check_token_permissions,
-    IA_checkInternetAccessForwardingProfile,
-    IA_enableInternetAccessForwardingProfile,
-    IA_createFilteringPolicy,
-    IA_createFilteringProfile,
-    IA_linkPolicyToFilteringProfile,
-    IA_createConditionalAccessPolicy,
-    IA_TLSPOCV2,
-    IA_internetAccessPoc,
-    GovernInternetAccessPOC,
-    IGA_listAccessPackages,
-    IGA_createAccessCatalog,
-    IGA_createAccessPackage,
-    IGA_addResourceGrouptoPackage,
-    IN_listIntuneManagedDevices,
-    IN_getManagedDeviceDetails,
-    IN_listDeviceCompliancePolicies,
-    IN_listDeviceConfigurationProfiles,
-    IN_syncManagedDevice,
-    IN_prepGSAWinClient,
-    IN_intuneAppAssignment,
-    EID_listUsers,
-    EID_getUser,
-    EID_searchUsers,
-    EID_listDevices,
-    EID_getDevice,
-    EID_getGroups,
-    EID_getGroup,
-    EID_getGroupMembers,
-    EID_searchGroups,
-    EID_createUserGroups,
-)
-from getset_pox_mcp.services.Test.hello_world_tools import get_hello_world_tool
-from getset_pox_mcp.services.Test.echo_tools import get_echo_tool
-from getset_pox_mcp.services.diagnostics.diagnostics_tools import get_check_token_permissions_tool
-from getset_pox_mcp.services.internetAccess.internetAccess_tools import (
-    get_IA_checkInternetAccessForwardingProfile_tool,
-    get_IA_enableInternetAccessForwardingProfile_tool,
-    get_IA_createFilteringPolicy_tool,
-    get_IA_createFilteringProfile_tool,
-    get_IA_linkPolicyToFilteringProfile_tool,
-    get_IA_createConditionalAccessPolicy_tool,
-    get_IA_TLSPOCV2_tool,
-    get_IA_internetAccessPoc_tool,
-)
-from getset_pox_mcp.services.poc.poc_tools import get_GovernInternetAccessPOC_tool
-from getset_pox_mcp.services.iga.iga_tools import (
-    get_IGA_listAccessPackages_tool,
-    get_IGA_createAccessCatalog_tool,
-    get_IGA_createAccessPackage_tool,
-    get_IGA_addResourceGrouptoPackage_tool,
-)
-from getset_pox_mcp.services.intune.intune_tools import (
-    get_IN_listIntuneManagedDevices_tool,
-    get_IN_getManagedDeviceDetails_tool,
-    get_IN_listDeviceCompliancePolicies_tool,
-    get_IN_listDeviceConfigurationProfiles_tool,
-    get_IN_syncManagedDevice_tool,
-    get_IN_prepGSAWinClient_tool,
-    get_IN_intuneAppAssignment_tool,
-)
-from getset_pox_mcp.services.eid.eid_tools import (
-    get_EID_listUsers_tool,
-    get_EID_getUser_tool,
-    get_EID_searchUsers_tool,
-    get_EID_listDevices_tool,
-    get_EID_getDevice_tool,
-    get_EID_getGroups_tool,
-    get_EID_getGroup_tool,
-    get_EID_getGroupMembers_tool,
-    get_EID_searchGroups_tool,
-    get_EID_createUserGroups_tool,
-)
 from getset_pox_mcp.authentication.middleware import get_auth_middleware
 
 # Initialize server
 mcp = Server("getset-pox-mcp")
 logger = get_logger(__name__)
 
+# orjson (Rust) serializes several times faster than stdlib json and sits
+# on the response path of every tool call; fall back to stdlib when the
+# optional dependency is not installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# O(1) tool dispatch table mapping tool name to service coroutine.
+# Populated by register_tools(); kept module-level so call_tool resolves
+# handlers with a single dict probe.
+_TOOL_DISPATCH: dict[str, Any] = {}
+
+# Startup authentication task, set by async_main when auth is enabled.
+# call_tool briefly waits on it so early tool calls queue behind the one
+# in-flight auth instead of each triggering their own retry.
+_startup_auth_task: asyncio.Task | None = None
+
 
 def register_tools() -> None:
     """Register all MCP tools with the server."""
-    
+
+    # Service and tool-factory imports are deferred to registration time:
+    # they pull in httpx and every service module, which merely importing
+    # getset_pox_mcp.server (entry-point resolution, tests) doesn't need.
+    from getset_pox_mcp.services import (
+        hello_world, echo, check_token_permissions,
+        IA_checkInternetAccessForwardingProfile,
+        IA_enableInternetAccessForwardingProfile,
+        IA_createFilteringPolicy,
+        IA_createFilteringProfile,
+        IA_linkPolicyToFilteringProfile,
+        IA_createConditionalAccessPolicy,
+        IA_TLSPOCV2,
+        IA_internetAccessPoc,
+        GovernInternetAccessPOC,
+        IGA_listAccessPackages,
+        IGA_createAccessCatalog,
+        IGA_createAccessPackage,
+        IGA_addResourceGrouptoPackage,
+        IGA_addResourceGroupsToPackage,
+        IN_listIntuneManagedDevices,
+        IN_getManagedDeviceDetails,
+        IN_listDeviceCompliancePolicies,
+        IN_listDeviceConfigurationProfiles,
+        IN_syncManagedDevice,
+        IN_prepGSAWinClient,
+        IN_intuneAppAssignment,
+        EID_listUsers,
+        EID_getUser,
+        EID_searchUsers,
+        EID_listDevices,
+        EID_getDevice,
+        EID_getGroups,
+        EID_getGroup,
+        EID_getGroupMembers,
+        EID_searchGroups,
+        EID_createUserGroups,
+    )
+    from getset_pox_mcp.services.Test.hello_world_tools import get_hello_world_tool
+    from getset_pox_mcp.services.Test.echo_tools import get_echo_tool
+    from getset_pox_mcp.services.diagnostics.diagnostics_tools import get_check_token_permissions_tool
+    from getset_pox_mcp.services.internetAccess.internetAccess_tools import (
+        get_IA_checkInternetAccessForwardingProfile_tool,
+        get_IA_enableInternetAccessForwardingProfile_tool,
+        get_IA_createFilteringPolicy_tool,
+        get_IA_createFilteringProfile_tool,
+        get_IA_linkPolicyToFilteringProfile_tool,
+        get_IA_createConditionalAccessPolicy_tool,
+        get_IA_TLSPOCV2_tool,
+        get_IA_internetAccessPoc_tool,
+    )
+    from getset_pox_mcp.services.poc.poc_tools import get_GovernInternetAccessPOC_tool
+    from getset_pox_mcp.services.iga.iga_tools import (
+        get_IGA_listAccessPackages_tool,
+        get_IGA_createAccessCatalog_tool,
+        get_IGA_createAccessPackage_tool,
+        get_IGA_addResourceGrouptoPackage_tool,
+        get_IGA_addResourceGroupsToPackage_tool,
+    )
+    from getset_pox_mcp.services.intune.intune_tools import (
+        get_IN_listIntuneManagedDevices_tool,
+        get_IN_getManagedDeviceDetails_tool,
+        get_IN_listDeviceCompliancePolicies_tool,
+        get_IN_listDeviceConfigurationProfiles_tool,
+        get_IN_syncManagedDevice_tool,
+        get_IN_prepGSAWinClient_tool,
+        get_IN_intuneAppAssignment_tool,
+    )
+    from getset_pox_mcp.services.eid.eid_tools import (
+        get_EID_listUsers_tool,
+        get_EID_getUser_tool,
+        get_EID_searchUsers_tool,
+        get_EID_listDevices_tool,
+        get_EID_getDevice_tool,
+        get_EID_getGroups_tool,
+        get_EID_getGroup_tool,
+        get_EID_getGroupMembers_tool,
+        get_EID_searchGroups_tool,
+        get_EID_createUserGroups_tool,
+    )
+
+    _TOOL_DISPATCH.update({
+        "hello_world": hello_world,
+        "echo": echo,
+        "check_token_permissions": check_token_permissions,
+        "IA_checkInternetAccessForwardingProfile": IA_checkInternetAccessForwardingProfile,
+        "IA_enableInternetAccessForwardingProfile": IA_enableInternetAccessForwardingProfile,
+        "IA_createFilteringPolicy": IA_createFilteringPolicy,
+        "IA_createFilteringProfile": IA_createFilteringProfile,
+        "IA_linkPolicyToFilteringProfile": IA_linkPolicyToFilteringProfile,
+        "IA_createConditionalAccessPolicy": IA_createConditionalAccessPolicy,
+        "IA_TLSPOCV2": IA_TLSPOCV2,
+        "IA_internetAccessPoc": IA_internetAccessPoc,
+        "GovernInternetAccessPOC": GovernInternetAccessPOC,
+        "IGA_listAccessPackages": IGA_listAccessPackages,
+        "IGA_createAccessCatalog": IGA_createAccessCatalog,
+        "IGA_createAccessPackage": IGA_createAccessPackage,
+        "IGA_addResourceGrouptoPackage": IGA_addResourceGrouptoPackage,
+        "IGA_addResourceGroupsToPackage": IGA_addResourceGroupsToPackage,
+        "IN_listIntuneManagedDevices": IN_listIntuneManagedDevices,
+        "IN_getManagedDeviceDetails": IN_getManagedDeviceDetails,
+        "IN_listDeviceCompliancePolicies": IN_listDeviceCompliancePolicies,
+        "IN_listDeviceConfigurationProfiles": IN_listDeviceConfigurationProfiles,
+        "IN_syncManagedDevice": IN_syncManagedDevice,
+        "IN_prepGSAWinClient": IN_prepGSAWinClient,
+        "IN_intuneAppAssignment": IN_intuneAppAssignment,
+        "EID_listUsers": EID_listUsers,
+        "EID_getUser": EID_getUser,
+        "EID_searchUsers": EID_searchUsers,
+        "EID_listDevices": EID_listDevices,
+        "EID_getDevice": EID_getDevice,
+        "EID_getGroups": EID_getGroups,
+        "EID_getGroup": EID_getGroup,
+        "EID_getGroupMembers": EID_getGroupMembers,
+        "EID_searchGroups": EID_searchGroups,
+        "EID_createUserGroups": EID_createUserGroups,
+    })
+
+
+    # Tool descriptors are static per-process; build the list once at
+    # registration instead of re-running 33 factory calls per discovery
+    # request
+    cached_tools: list[Tool] = [
+        get_hello_world_tool(),
+        get_echo_tool(),
+        get_check_token_permissions_tool(),
+        get_IA_checkInternetAccessForwardingProfile_tool(),
+        get_IA_enableInternetAccessForwardingProfile_tool(),
+        get_IA_createFilteringPolicy_tool(),
+        get_IA_createFilteringProfile_tool(),
+        get_IA_linkPolicyToFilteringProfile_tool(),
+        get_IA_createConditionalAccessPolicy_tool(),
+        get_IA_TLSPOCV2_tool(),
+        get_IA_internetAccessPoc_tool(),
+        get_GovernInternetAccessPOC_tool(),
+        get_IGA_listAccessPackages_tool(),
+        get_IGA_createAccessCatalog_tool(),
+        get_IGA_createAccessPackage_tool(),
+        get_IGA_addResourceGrouptoPackage_tool(),
+        get_IGA_addResourceGroupsToPackage_tool(),
+        get_IN_listIntuneManagedDevices_tool(),
+        get_IN_getManagedDeviceDetails_tool(),
+        get_IN_listDeviceCompliancePolicies_tool(),
+        get_IN_listDeviceConfigurationProfiles_tool(),
+        get_IN_syncManagedDevice_tool(),
+        get_IN_prepGSAWinClient_tool(),
+        get_IN_intuneAppAssignment_tool(),
+        get_EID_listUsers_tool(),
+        get_EID_getUser_tool(),
+        get_EID_searchUsers_tool(),
+        get_EID_listDevices_tool(),
+        get_EID_getDevice_tool(),
+        get_EID_getGroups_tool(),
+        get_EID_getGroup_tool(),
+        get_EID_getGroupMembers_tool(),
+        get_EID_searchGroups_tool(),
+        get_EID_createUserGroups_tool(),
+    ]
+
     @mcp.list_tools()
     async def list_tools() -> list[Tool]:
         """
         List all available tools.
-        
+
         Returns:
             List of Tool objects describing available tools.
         """
-        return [
-            get_hello_world_tool(),
-            get_echo_tool(),
-            get_check_token_permissions_tool(),
-            get_IA_checkInternetAccessForwardingProfile_tool(),
-            get_IA_enableInternetAccessForwardingProfile_tool(),
-            get_IA_createFilteringPolicy_tool(),
-            get_IA_createFilteringProfile_tool(),
-            get_IA_linkPolicyToFilteringProfile_tool(),
-            get_IA_createConditionalAccessPolicy_tool(),
-            get_IA_TLSPOCV2_tool(),
-            get_IA_internetAccessPoc_tool(),
-            get_GovernInternetAccessPOC_tool(),
-            get_IGA_listAccessPackages_tool(),
-            get_IGA_createAccessCatalog_tool(),
-            get_IGA_createAccessPackage_tool(),
-            get_IGA_addResourceGrouptoPackage_tool(),
-            get_IN_listIntuneManagedDevices_tool(),
-            get_IN_getManagedDeviceDetails_tool(),
-            get_IN_listDeviceCompliancePolicies_tool(),
-            get_IN_listDeviceConfigurationProfiles_tool(),
-            get_IN_syncManagedDevice_tool(),
-            get_IN_prepGSAWinClient_tool(),
-            get_IN_intuneAppAssignment_tool(),
-            get_EID_listUsers_tool(),
-            get_EID_getUser_tool(),
-            get_EID_searchUsers_tool(),
-            get_EID_listDevices_tool(),
-            get_EID_getDevice_tool(),
-            get_EID_getGroups_tool(),
-            get_EID_getGroup_tool(),
-            get_EID_getGroupMembers_tool(),
-            get_EID_searchGroups_tool(),
-            get_EID_createUserGroups_tool(),
-        ]
-    
+        return cached_tools
+
     @mcp.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """
@@ -157,97 +233,42 @@ def register_tools() -> None:
         Raises:
             ValueError: If the tool name is unknown.
         """
-        logger.info(f"Tool called: {name} with arguments: {arguments}")
-        
+        logger.info("Tool called: %s with arguments: %s", name, arguments)
+
+        # Give a just-started background auth a moment to finish; shield
+        # keeps a timeout here from cancelling the shared startup task
+        task = _startup_auth_task
+        if task is not None and not task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=5.0)
+            except Exception:
+                logger.warning("Startup authentication still pending; proceeding")
+
         try:
-            if name == "hello_world":
-                result = await hello_world(**arguments)
-            elif name == "echo":
-                result = await echo(**arguments)
-            elif name == "check_token_permissions":
-                result = await check_token_permissions(**arguments)
-            elif name == "IA_checkInternetAccessForwardingProfile":
-                result = await IA_checkInternetAccessForwardingProfile(**arguments)
-            elif name == "IA_enableInternetAccessForwardingProfile":
-                result = await IA_enableInternetAccessForwardingProfile(**arguments)
-            elif name == "IA_createFilteringPolicy":
-                result = await IA_createFilteringPolicy(**arguments)
-            elif name == "IA_createFilteringProfile":
-                result = await IA_createFilteringProfile(**arguments)
-            elif name == "IA_linkPolicyToFilteringProfile":
-                result = await IA_linkPolicyToFilteringProfile(**arguments)
-            elif name == "IA_createConditionalAccessPolicy":
-                result = await IA_createConditionalAccessPolicy(**arguments)
-            elif name == "IA_TLSPOCV2":
-                result = await IA_TLSPOCV2(**arguments)
-            elif name == "IA_internetAccessPoc":
-                result = await IA_internetAccessPoc(**arguments)
-            elif name == "GovernInternetAccessPOC":
-                result = await GovernInternetAccessPOC(**arguments)
-            elif name == "IGA_listAccessPackages":
-                result = await IGA_listAccessPackages(**arguments)
-            elif name == "IGA_createAccessCatalog":
-                result = await IGA_createAccessCatalog(**arguments)
-            elif name == "IGA_createAccessPackage":
-                result = await IGA_createAccessPackage(**arguments)
-            elif name == "IGA_addResourceGrouptoPackage":
-                result = await IGA_addResourceGrouptoPackage(**arguments)
-            elif name == "IN_listIntuneManagedDevices":
-                result = await IN_listIntuneManagedDevices(**arguments)
-            elif name == "IN_getManagedDeviceDetails":
-                result = await IN_getManagedDeviceDetails(**arguments)
-            elif name == "IN_listDeviceCompliancePolicies":
-                result = await IN_listDeviceCompliancePolicies(**arguments)
-            elif name == "IN_listDeviceConfigurationProfiles":
-                result = await IN_listDeviceConfigurationProfiles(**arguments)
-            elif name == "IN_syncManagedDevice":
-                result = await IN_syncManagedDevice(**arguments)
-            elif name == "IN_prepGSAWinClient":
-                result = await IN_prepGSAWinClient(**arguments)
-            elif name == "IN_intuneAppAssignment":
-                result = await IN_intuneAppAssignment(**arguments)
-            elif name == "EID_listUsers":
-                result = await EID_listUsers(**arguments)
-            elif name == "EID_getUser":
-                result = await EID_getUser(**arguments)
-            elif name == "EID_searchUsers":
-                result = await EID_searchUsers(**arguments)
-            elif name == "EID_listDevices":
-                result = await EID_listDevices(**arguments)
-            elif name == "EID_getDevice":
-                result = await EID_getDevice(**arguments)
-            elif name == "EID_getGroups":
-                result = await EID_getGroups(**arguments)
-            elif name == "EID_getGroup":
-                result = await EID_getGroup(**arguments)
-            elif name == "EID_getGroupMembers":
-                result = await EID_getGroupMembers(**arguments)
-            elif name == "EID_searchGroups":
-                result = await EID_searchGroups(**arguments)
-            elif name == "EID_createUserGroups":
-                result = await EID_createUserGroups(**arguments)
-            else:
+            handler = _TOOL_DISPATCH.get(name)
+            if handler is None:
                 error_msg = f"Unknown tool: {name}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
+
+            result = await handler(**arguments)
             
-            logger.debug(f"Tool {name} returned: {result}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool %s returned: %s", name, result)
             
             # Format result as JSON string
-            import json
-            result_text = json.dumps(result, indent=2)
+            result_text = _dumps(result)
             
             return [TextContent(type="text", text=result_text)]
             
         except Exception as e:
-            logger.exception(f"Error executing tool {name}: {e}")
+            logger.exception("Error executing tool %s: %s", name, e)
             error_response = {
                 "error": str(e),
                 "tool": name,
                 "arguments": arguments,
             }
-            import json
-            return [TextContent(type="text", text=json.dumps(error_response, indent=2))]
+            return [TextContent(type="text", text=_dumps(error_response))]
 
 
 async def run_stdio() -> None:
@@ -338,7 +359,8 @@ async def async_main() -> None:
     # This prevents blocking the MCP server initialization
     if auth_status['enabled']:
         logger.info("Server authentication will occur in background")
-        asyncio.create_task(auth_middleware.authenticate_server())
+        global _startup_auth_task
+        _startup_auth_task = asyncio.create_task(auth_middleware.authenticate_server())
     
     # Register tools
     register_tools()
@@ -355,6 +377,17 @@ async def async_main() -> None:
 
 def main() -> None:
     """Main entry point for the server."""
+    # uvloop (libuv-backed loop) is a drop-in replacement that is
+    # noticeably faster for I/O-heavy asyncio workloads; use it when the
+    # optional dependency is installed (it does not support Windows)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
+
     try:
         asyncio.run(async_main())
     except KeyboardInterrupt:
@@ -5,7 +5,7 @@ This service provides an echo tool that returns the input message
 along with metadata, demonstrating parameter handling and structured responses.
 """
 
-from datetime import datetime, timezone
+import time
 from typing import Any
 from getset_pox_mcp.logging_config import get_logger
 
@@ -40,7 +40,7 @@ async def echo(message: str, uppercase: bool = False) -> dict[str, Any]:
             "service": "echo"
         }
     """
-    logger.info(f"Echo service called with message: '{message}', uppercase: {uppercase}")
+    logger.info("Echo service called with message: '%s', uppercase: %s", message, uppercase)
     
     # Input validation
     if not message or not isinstance(message, str):
@@ -51,13 +51,17 @@ async def echo(message: str, uppercase: bool = False) -> dict[str, Any]:
     # Process message
     echoed_message = message.upper() if uppercase else message
     
-    # Generate timestamp
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Generate timestamp without the datetime/tzinfo round trip: format
+    # the whole seconds once and append the microseconds and "Z" directly
+    now = time.time()
+    whole = int(now)
+    frac = int((now - whole) * 1_000_000)
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole)) + f".{frac:06d}Z"
     
     # Calculate message length
     message_length = len(message)
     
-    logger.debug(f"Processed echo: original='{message}', echoed='{echoed_message}'")
+    logger.debug("Processed echo: original='%s', echoed='%s'", message, echoed_message)
     
     return {
         "original": message,
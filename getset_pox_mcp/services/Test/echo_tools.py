@@ -6,6 +6,29 @@ This module defines the MCP tool schemas and handlers for the Echo service.
 
 from mcp.types import Tool
 
+# Static schema: validate the pydantic Tool once at import and let
+# the getter return the shared instance
+
+_echo_TOOL = Tool(
+    name="echo",
+    description="Echo back the provided message with metadata",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "message": {
+                "type": "string",
+                "description": "The message to echo back",
+            },
+            "uppercase": {
+                "type": "boolean",
+                "description": "If true, return the message in uppercase",
+                "default": False,
+            },
+        },
+        "required": ["message"],
+    },
+)
+
 def get_echo_tool() -> Tool:
     """
     Get the MCP Tool definition for echo.
@@ -13,22 +36,4 @@ def get_echo_tool() -> Tool:
     Returns:
         Tool object with schema definition.
     """
-    return Tool(
-        name="echo",
-        description="Echo back the provided message with metadata",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "message": {
-                    "type": "string",
-                    "description": "The message to echo back",
-                },
-                "uppercase": {
-                    "type": "boolean",
-                    "description": "If true, return the message in uppercase",
-                    "default": False,
-                },
-            },
-            "required": ["message"],
-        },
-    )
+    return _echo_TOOL
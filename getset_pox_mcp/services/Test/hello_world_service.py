@@ -10,6 +10,14 @@ from getset_pox_mcp.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Canned response for the default/fallback name; the common demo call
+# skips the f-string and dict construction entirely
+_DEFAULT_GREETING = {
+    "message": "Hello, World! Welcome to getset-pox-mcp.",
+    "name": "World",
+    "service": "hello_world",
+}
+
 async def hello_world(name: str = "World") -> dict[str, Any]:
     """
     Generate a personalized greeting message.
@@ -31,22 +39,25 @@ async def hello_world(name: str = "World") -> dict[str, Any]:
             "service": "hello_world"
         }
     """
-    logger.info(f"HelloWorld service called with name: {name}")
+    logger.info("HelloWorld service called with name: %s", name)
     
-    # Input validation
+    # Validate and sanitize in one pass; anything empty or non-string
+    # falls back to the canned default response. strip() only runs when
+    # the edges actually hold whitespace, so pre-trimmed input keeps its
+    # original string object
     if not name or not isinstance(name, str):
-        logger.warning(f"Invalid name parameter: {name}")
-        name = "World"
+        logger.warning("Invalid name parameter: %s", name)
+        name = ""
+    elif name[0] <= " " or name[-1] <= " ":
+        name = name.strip()
     
-    # Sanitize input
-    name = name.strip()
-    if not name:
-        name = "World"
+    if not name or name == "World":
+        return _DEFAULT_GREETING.copy()
     
     # Generate response
     message = f"Hello, {name}! Welcome to getset-pox-mcp."
     
-    logger.debug(f"Generated greeting: {message}")
+    logger.debug("Generated greeting: %s", message)
     
     return {
         "message": message,
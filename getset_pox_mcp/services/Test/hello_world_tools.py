@@ -6,6 +6,25 @@ This module defines the MCP tool schemas and handlers for the HelloWorld service
 
 from mcp.types import Tool
 
+# Static schema: validate the pydantic Tool once at import and let
+# the getter return the shared instance
+
+_hello_world_TOOL = Tool(
+    name="hello_world",
+    description="Generate a personalized greeting message",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "The name to include in the greeting",
+                "default": "World",
+            }
+        },
+        "required": [],
+    },
+)
+
 def get_hello_world_tool() -> Tool:
     """
     Get the MCP Tool definition for hello_world.
@@ -13,18 +32,4 @@ def get_hello_world_tool() -> Tool:
     Returns:
         Tool object with schema definition.
     """
-    return Tool(
-        name="hello_world",
-        description="Generate a personalized greeting message",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "The name to include in the greeting",
-                    "default": "World",
-                }
-            },
-            "required": [],
-        },
-    )
+    return _hello_world_TOOL
@@ -3,82 +3,68 @@ Services package for getset-pox-mcp.
 
 This package contains all MCP tool implementations and service modules.
 Each service module should define tools that can be registered with the MCP server.
+
+Service symbols are resolved lazily (PEP 562): importing this package no
+longer drags in httpx and every service module up front — each module
+loads on first attribute access and the resolved symbol is cached in the
+package namespace.
 """
 
-from getset_pox_mcp.services.Test.hello_world_service import hello_world
-from getset_pox_mcp.services.Test.echo_service import echo
-from getset_pox_mcp.services.diagnostics.diagnostics_service import check_token_permissions
-from getset_pox_mcp.services.internetAccess.internetAccess_service import (
-    IA_checkInternetAccessForwardingProfile,
-    IA_enableInternetAccessForwardingProfile,
-    IA_createFilteringPolicy,
-    IA_createFilteringProfile,
-    IA_linkPolicyToFilteringProfile,
-    IA_createConditionalAccessPolicy,
-    IA_TLSPOCV2,
-    IA_internetAccessPoc,
-)
-from getset_pox_mcp.services.poc.poc_service import GovernInternetAccessPOC
-from getset_pox_mcp.services.iga.iga_service import (
-    IGA_listAccessPackages,
-    IGA_createAccessCatalog,
-    IGA_createAccessPackage,
-    IGA_addResourceGrouptoPackage,
-)
-from getset_pox_mcp.services.intune.intune_service import (
-    IN_listIntuneManagedDevices,
-    IN_getManagedDeviceDetails,
-    IN_listDeviceCompliancePolicies,
-    IN_listDeviceConfigurationProfiles,
-    IN_syncManagedDevice,
-    IN_prepGSAWinClient,
-    IN_intuneAppAssignment,
-)
-from getset_pox_mcp.services.eid.eid_service import (
-    EID_listUsers,
-    EID_getUser,
-    EID_searchUsers,
-    EID_listDevices,
-    EID_getDevice,
-    EID_getGroups,
-    EID_getGroup,
-    EID_getGroupMembers,
-    EID_searchGroups,
-    EID_createUserGroups,
-)
+from importlib import import_module
+
+# Tool registry: tool name -> (defining module, callable name). Doubles
+# as the lazy-import table — consumers can enumerate tools from the keys
+# without importing any implementation module.
+SERVICE_REGISTRY: dict[str, tuple[str, str]] = {
+    "hello_world": ("getset_pox_mcp.services.Test.hello_world_service", "hello_world"),
+    "echo": ("getset_pox_mcp.services.Test.echo_service", "echo"),
+    "check_token_permissions": ("getset_pox_mcp.services.diagnostics.diagnostics_service", "check_token_permissions"),
+    "IA_checkInternetAccessForwardingProfile": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_checkInternetAccessForwardingProfile"),
+    "IA_enableInternetAccessForwardingProfile": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_enableInternetAccessForwardingProfile"),
+    "IA_createFilteringPolicy": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_createFilteringPolicy"),
+    "IA_createFilteringProfile": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_createFilteringProfile"),
+    "IA_linkPolicyToFilteringProfile": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_linkPolicyToFilteringProfile"),
+    "IA_createConditionalAccessPolicy": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_createConditionalAccessPolicy"),
+    "IA_TLSPOCV2": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_TLSPOCV2"),
+    "IA_internetAccessPoc": ("getset_pox_mcp.services.internetAccess.internetAccess_service", "IA_internetAccessPoc"),
+    "GovernInternetAccessPOC": ("getset_pox_mcp.services.poc.poc_service", "GovernInternetAccessPOC"),
+    "IGA_listAccessPackages": ("getset_pox_mcp.services.iga.iga_service", "IGA_listAccessPackages"),
+    "IGA_createAccessCatalog": ("getset_pox_mcp.services.iga.iga_service", "IGA_createAccessCatalog"),
+    "IGA_createAccessPackage": ("getset_pox_mcp.services.iga.iga_service", "IGA_createAccessPackage"),
+    "IGA_addResourceGrouptoPackage": ("getset_pox_mcp.services.iga.iga_service", "IGA_addResourceGrouptoPackage"),
+    "IGA_addResourceGroupsToPackage": ("getset_pox_mcp.services.iga.iga_service", "IGA_addResourceGroupsToPackage"),
+    "IN_listIntuneManagedDevices": ("getset_pox_mcp.services.intune.intune_service", "IN_listIntuneManagedDevices"),
+    "IN_getManagedDeviceDetails": ("getset_pox_mcp.services.intune.intune_service", "IN_getManagedDeviceDetails"),
+    "IN_listDeviceCompliancePolicies": ("getset_pox_mcp.services.intune.intune_service", "IN_listDeviceCompliancePolicies"),
+    "IN_listDeviceConfigurationProfiles": ("getset_pox_mcp.services.intune.intune_service", "IN_listDeviceConfigurationProfiles"),
+    "IN_syncManagedDevice": ("getset_pox_mcp.services.intune.intune_service", "IN_syncManagedDevice"),
+    "IN_prepGSAWinClient": ("getset_pox_mcp.services.intune.intune_service", "IN_prepGSAWinClient"),
+    "IN_intuneAppAssignment": ("getset_pox_mcp.services.intune.intune_service", "IN_intuneAppAssignment"),
+    "EID_listUsers": ("getset_pox_mcp.services.eid.eid_service", "EID_listUsers"),
+    "EID_getUser": ("getset_pox_mcp.services.eid.eid_service", "EID_getUser"),
+    "EID_searchUsers": ("getset_pox_mcp.services.eid.eid_service", "EID_searchUsers"),
+    "EID_listDevices": ("getset_pox_mcp.services.eid.eid_service", "EID_listDevices"),
+    "EID_getDevice": ("getset_pox_mcp.services.eid.eid_service", "EID_getDevice"),
+    "EID_getGroups": ("getset_pox_mcp.services.eid.eid_service", "EID_getGroups"),
+    "EID_getGroup": ("getset_pox_mcp.services.eid.eid_service", "EID_getGroup"),
+    "EID_getGroupMembers": ("getset_pox_mcp.services.eid.eid_service", "EID_getGroupMembers"),
+    "EID_searchGroups": ("getset_pox_mcp.services.eid.eid_service", "EID_searchGroups"),
+    "EID_createUserGroups": ("getset_pox_mcp.services.eid.eid_service", "EID_createUserGroups"),
+}
+
+__all__ = list(SERVICE_REGISTRY)
+
+
+def __getattr__(name: str):
+    """Resolve a service symbol on first access and cache it."""
+    try:
+        module_name, attr_name = SERVICE_REGISTRY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "hello_world",
-    "echo",
-    "check_token_permissions",
-    "IA_checkInternetAccessForwardingProfile",
-    "IA_enableInternetAccessForwardingProfile",
-    "IA_createFilteringPolicy",
-    "IA_createFilteringProfile",
-    "IA_linkPolicyToFilteringProfile",
-    "IA_createConditionalAccessPolicy",
-    "IA_TLSPOCV2",
-    "IA_internetAccessPoc",
-    "GovernInternetAccessPOC",
-    "IGA_listAccessPackages",
-    "IGA_createAccessCatalog",
-    "IGA_createAccessPackage",
-    "IGA_addResourceGrouptoPackage",
-    "IN_listIntuneManagedDevices",
-    "IN_getManagedDeviceDetails",
-    "IN_listDeviceCompliancePolicies",
-    "IN_listDeviceConfigurationProfiles",
-    "IN_syncManagedDevice",
-    "IN_prepGSAWinClient",
-    "IN_intuneAppAssignment",
-    "EID_listUsers",
-    "EID_getUser",
-    "EID_searchUsers",
-    "EID_listDevices",
-    "EID_getDevice",
-    "EID_getGroups",
-    "EID_getGroup",
-    "EID_getGroupMembers",
-    "EID_searchGroups",
-    "EID_createUserGroups",
-]
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -6,6 +6,25 @@ This module defines the MCP tool schemas for the diagnostics service.
 
 from mcp.types import Tool
 
+# Static schema: validate the pydantic Tool once at import and let
+# the getter return the shared instance
+
+_check_token_permissions_TOOL = Tool(
+    name="check_token_permissions",
+    description="Check Microsoft Graph API token permissions and troubleshoot access issues",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "graph_client": {
+                "type": ["object", "null"],
+                "description": "Optional Graph API client instance (uses global if not provided)",
+                "default": None,
+            }
+        },
+        "required": [],
+    },
+)
+
 def get_check_token_permissions_tool() -> Tool:
     """
     Get the MCP Tool definition for check_token_permissions.
@@ -13,18 +32,4 @@ def get_check_token_permissions_tool() -> Tool:
     Returns:
         Tool object with schema definition.
     """
-    return Tool(
-        name="check_token_permissions",
-        description="Check Microsoft Graph API token permissions and troubleshoot access issues",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "graph_client": {
-                    "type": ["object", "null"],
-                    "description": "Optional Graph API client instance (uses global if not provided)",
-                    "default": None,
-                }
-            },
-            "required": [],
-        },
-    )
+    return _check_token_permissions_TOOL
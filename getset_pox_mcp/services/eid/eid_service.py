@@ -9,415 +9,726 @@ Dependencies:
     - Authentication via auth_middleware for token management
 """
 
-from typing import Any, List, Optional
+import functools
+from typing import Any, List, Optional, TypedDict
 from getset_pox_mcp.logging_config import get_logger
 from getset_pox_mcp.authentication.middleware import get_auth_middleware
+from importlib.util import find_spec
+
 import httpx
+import io
 import json
+import os
 import asyncio
+import random
+import re
+import time
 
 logger = get_logger(__name__)
 
+# Shared Graph client: one keep-alive pool (HTTP/2 when the optional h2
+# package is installed) reused across all EID tool calls instead of a
+# fresh TLS handshake per invocation
+# orjson (Rust) parses straight from bytes, skipping the UTF-8 str
+# decode that httpx performs before handing stdlib json.loads the
+# payload; fall back to the stdlib when the optional dependency is
+# absent
+try:
+    import orjson
+
+    def _loads(payload: bytes) -> Any:
+        return orjson.loads(payload)
+except ImportError:
+    def _loads(payload: bytes) -> Any:
+        return json.loads(payload)
+
+# ijson parses records out of the body as bytes arrive, keeping peak
+# memory at one record instead of raw-bytes-plus-DOM; optional like
+# orjson, with the buffered path as fallback
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    client = _client
+    if client is not None:
+        return client
+    async with _client_lock:
+        if _client is None:
+            _client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            )
+            logger.debug(
+                "Shared Graph client created (http2=%s)", _HTTP2_AVAILABLE
+            )
+    return _client
+
+
+# Validated-token memo: the middleware already refreshes near expiry,
+# but re-validating on every tool call is wasted work on the hot path.
+# Reuse a token for up to 4 minutes — well under any real token
+# lifetime — then ask the middleware again.
+_token_cache: dict[str, Any] = {"value": None, "exp": 0.0}
+
+
+async def _cached_token() -> Optional[str]:
+    """Return a recently validated token, consulting the middleware on miss."""
+    now = time.monotonic()
+    if _token_cache["value"] and _token_cache["exp"] - now > 30:
+        return _token_cache["value"]
+    token = await get_auth_middleware().get_valid_token()
+    if token:
+        _token_cache["value"] = token
+        _token_cache["exp"] = now + 240
+    return token
+
+
+# Typed response contracts for the EID tools. These are plain dicts at
+# runtime — the MCP boundary encodes them once with orjson on egress —
+# but give callers and the type checker a schema per endpoint.
+class ErrorResponse(TypedDict):
+    status: str
+    message: str
+
+
+class UsersResponse(TypedDict):
+    status: str
+    users: List[dict]
+    count: int
+
+
+class UserSearchResponse(UsersResponse):
+    query: str
+
+
+class UserResponse(TypedDict):
+    status: str
+    user: dict
+
+
+class DevicesResponse(TypedDict):
+    status: str
+    devices: List[dict]
+    count: int
+
+
+class DeviceResponse(TypedDict):
+    status: str
+    device: dict
+
+
+class GroupsResponse(TypedDict):
+    status: str
+    groups: List[dict]
+    count: int
+    nextLink: Optional[str]
+
+
+class GroupSearchResponse(TypedDict):
+    status: str
+    groups: List[dict]
+    count: int
+    query: str
+
+
+class GroupResponse(TypedDict):
+    status: str
+    group: dict
+
+
+class GroupMembersResponse(TypedDict):
+    status: str
+    members: List[dict]
+    count: int
+    group_id: str
+    nextLink: Optional[str]
+
+
+# mailNickname must be alphanumeric; a compiled regex strips the rest
+# at C speed instead of a per-character Python generator
+_NONALNUM = re.compile(r"[^A-Za-z0-9]+")
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 6
+
+# Cap aggregate in-flight Graph requests across every EID tool. Each
+# tool bounds its own fan-out, but nothing stopped fifty concurrent
+# tool calls from stacking up and tripping 429 storms; a module-wide
+# semaphore keeps total concurrency near the per-app service ceiling.
+_graph_sem = asyncio.Semaphore(int(os.environ.get("GRAPH_MAX_CONCURRENCY", "16")))
+
+
+async def _graph_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Issue a Graph request, retrying throttled and transient failures.
+
+    Graph signals throttling with 429 (and transient faults with 5xx)
+    alongside a Retry-After header; the header is honored when present,
+    otherwise the wait backs off exponentially with jitter. The final
+    response is returned as-is so callers keep their own status
+    handling.
+    """
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        async with _graph_sem:
+            response = await client.request(method, url, **kwargs)
+        logger.debug("%s %s -> %s (%s)", method, url, response.status_code, response.http_version)
+        if response.status_code not in _RETRYABLE_STATUSES or attempt == _MAX_ATTEMPTS:
+            break
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = min(0.5 * 2 ** (attempt - 1), 30.0) * (0.5 + random.random() / 2)
+        logger.warning(
+            "Graph returned %s for %s %s; retrying in %.1fs (attempt %d/%d)",
+            response.status_code, method, url, delay, attempt, _MAX_ATTEMPTS,
+        )
+        await asyncio.sleep(delay)
+    return response
+
+
+async def _stream_value_items(
+    client: httpx.AsyncClient,
+    headers: dict,
+    url: str,
+    params: Optional[dict] = None,
+) -> List[dict]:
+    """
+    Stream the 'value' rows of a Graph collection response.
+
+    Extracts records incrementally from the wire with ijson instead of
+    buffering the whole body and decoding a DOM; retries throttled and
+    transient statuses the same way _graph_request does. Only suitable
+    for endpoints that need nothing but the value array.
+    """
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        async with _graph_sem:
+            async with client.stream("GET", url, headers=headers, params=params) as response:
+                if response.status_code not in _RETRYABLE_STATUSES or attempt == _MAX_ATTEMPTS:
+                    response.raise_for_status()
+                    return [item async for item in ijson.items(response.aiter_bytes(), "value.item")]
+                retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = min(0.5 * 2 ** (attempt - 1), 30.0) * (0.5 + random.random() / 2)
+        logger.warning(
+            "Graph returned %s for GET %s; retrying in %.1fs (attempt %d/%d)",
+            response.status_code, url, delay, attempt, _MAX_ATTEMPTS,
+        )
+        await asyncio.sleep(delay)
+    return []
+
+
+async def _paginate(
+    client: httpx.AsyncClient,
+    headers: dict,
+    url: str,
+    params: Optional[dict] = None,
+    max_items: Optional[int] = None,
+) -> List[dict]:
+    """
+    Collect a Graph collection across @odata.nextLink pages.
+
+    Follows pagination server-side in one tool call instead of
+    round-tripping each nextLink through the MCP client. Graph only
+    reveals a nextLink in the previous page's body, so pages are
+    fetched sequentially; max_items stops the walk early.
+    """
+    items: List[dict] = []
+    next_url: Optional[str] = url
+    while next_url and (max_items is None or len(items) < max_items):
+        response = await _graph_request(client, "GET", next_url, headers=headers, params=params)
+        # nextLink is a complete URL; query params only apply to page one
+        params = None
+        response.raise_for_status()
+        data = _loads(response.content)
+        items.extend(data.get("value", []))
+        next_url = data.get("@odata.nextLink")
+    if max_items is not None:
+        del items[max_items:]
+    return items
+
 
-async def EID_listUsers() -> dict[str, Any]:
+async def _graph_batch(
+    client: httpx.AsyncClient,
+    headers: dict,
+    requests: List[dict],
+) -> List[dict]:
+    """
+    Execute Graph sub-requests through POST /v1.0/$batch.
+
+    Folds up to 20 sub-requests into each HTTP call, returning the
+    combined list of sub-responses in submission order.
+    """
+    responses: List[dict] = []
+    for start in range(0, len(requests), 20):
+        chunk = requests[start:start + 20]
+        batch_response = await _graph_request(
+            client,
+            "POST",
+            "https://graph.microsoft.com/v1.0/$batch",
+            headers=headers,
+            json={"requests": chunk},
+        )
+        batch_response.raise_for_status()
+        responses.extend(_loads(batch_response.content).get("responses", []))
+    # Graph may return sub-responses out of order; restore submission order
+    responses.sort(key=lambda r: int(r.get("id", 0)))
+    return responses
+
+
+def _batch_error(sub_response: Optional[dict]) -> str:
+    """Human-readable error for a failed $batch sub-response."""
+    if not sub_response:
+        return "No response returned for batch sub-request"
+    detail = (sub_response.get("body") or {}).get("error", {}).get("message")
+    status = sub_response.get("status")
+    return f"HTTP {status}: {detail}" if detail else f"HTTP {status}"
+
+
+def graph_tool(error_label: str):
+    """
+    Wrap an EID tool with the shared auth/client/error scaffolding.
+
+    The decorated coroutine receives the shared client and a headers
+    dict carrying the bearer token as its first two arguments; token
+    acquisition, the auth-unavailable early return, and the catch-all
+    error response are handled here once instead of per function.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            try:
+                token = await _cached_token()
+
+                if not token:
+                    return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
+
+                headers = {"Authorization": f"Bearer {token}"}
+                client = await _get_client()
+                return await fn(client, headers, *args, **kwargs)
+            except Exception as error:
+                logger.error(f"Error {error_label}: {error}")
+                return {"status": "error", "message": f"Error {error_label}: {str(error)}"}
+        return wrapper
+    return decorator
+
+
+async def aclose_client() -> None:
+    """Close the shared client; call from server shutdown or tests."""
+    global _client
+    async with _client_lock:
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+
+@graph_tool("listing users")
+async def EID_listUsers(client: httpx.AsyncClient, headers: dict, fetch_all: bool = False) -> UsersResponse | ErrorResponse:
     """
     List all users from Microsoft Graph API v1.0.
-    
+
+    Args:
+        fetch_all: Follow @odata.nextLink pages server-side and return
+            every user instead of just the first page (default: False)
+
     Returns:
         Dictionary containing list of users with count and status.
     """
     logger.info("EID_listUsers called")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://graph.microsoft.com/v1.0/users",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
+
+    url = "https://graph.microsoft.com/v1.0/users"
+    if fetch_all:
+        users = await _paginate(client, headers, url)
+    elif ijson is not None:
+        users = await _stream_value_items(client, headers, url)
+    else:
+        response = await _graph_request(
+            client,
+            "GET",
+            url,
+            headers=headers
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
         users = data.get("value", [])
-        return {
-            "status": "success",
-            "users": users,
-            "count": len(users),
-            "message": json.dumps(users, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error listing users: {error}")
-        return {"status": "error", "message": f"Error listing users: {str(error)}"}
+
+    return {
+        "status": "success",
+        "users": users,
+        "count": len(users)
+    }
 
 
-async def EID_getUser(user_id: str) -> dict[str, Any]:
+@graph_tool("getting user")
+async def EID_getUser(client: httpx.AsyncClient, headers: dict, user_id: str) -> UserResponse | ErrorResponse:
     """
     Get a specific user by ID from Microsoft Graph API v1.0.
-    
+
     Args:
         user_id: The ID or userPrincipalName of the user
-        
+
     Returns:
         Dictionary containing user details or error message.
     """
     logger.info(f"EID_getUser called: user_id={user_id}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/users/{user_id}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
-        return {
-            "status": "success",
-            "user": data,
-            "message": json.dumps(data, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error getting user: {error}")
-        return {"status": "error", "message": f"Error getting user: {str(error)}"}
+
+    response = await _graph_request(
+        client,
+        "GET",
+        f"https://graph.microsoft.com/v1.0/users/{user_id}",
+        headers=headers
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
+
+    return {
+        "status": "success",
+        "user": data
+    }
 
 
-async def EID_searchUsers(query: str, top: int = 50) -> dict[str, Any]:
+@graph_tool("searching users")
+async def EID_searchUsers(client: httpx.AsyncClient, headers: dict, query: str, top: int = 50) -> UserSearchResponse | ErrorResponse:
     """
     Search for users in Microsoft Graph API by display name or email.
-    
+
     Args:
         query: Search query string
         top: Maximum number of results to return (default: 50, max: 999)
-        
+
     Returns:
         Dictionary containing list of matching users or error message.
     """
     logger.info(f"EID_searchUsers called: query={query}, top={top}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Limit top parameter
-        top = max(1, min(top, 999))
-        
-        # Search users using filter
-        filter_query = f"startswith(displayName,'{query}') or startswith(userPrincipalName,'{query}')"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/users?$filter={filter_query}&$select=id,displayName,mail,userPrincipalName&$top={top}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
-        users = data.get("value", [])
-        return {
-            "status": "success",
-            "users": users,
-            "count": len(users),
-            "query": query,
-            "message": json.dumps(users, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error searching users: {error}")
-        return {"status": "error", "message": f"Error searching users: {str(error)}"}
 
+    # $search with ConsistencyLevel: eventual hits Graph's full-text
+    # index instead of the table scan startswith() filters cause;
+    # params= lets httpx URL-encode the query safely
+    headers = {**headers, "ConsistencyLevel": "eventual"}
+
+    # Limit top parameter
+    top = max(1, min(top, 999))
 
-async def EID_listDevices() -> dict[str, Any]:
+    params = {
+        "$search": f'"displayName:{query}" OR "userPrincipalName:{query}"',
+        "$select": "id,displayName,mail,userPrincipalName",
+        "$top": top,
+        "$count": "true",
+    }
+
+    response = await _graph_request(
+        client,
+        "GET",
+        "https://graph.microsoft.com/v1.0/users",
+        headers=headers,
+        params=params
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
+
+    users = data.get("value", [])
+    return {
+        "status": "success",
+        "users": users,
+        "count": len(users),
+        "query": query
+    }
+
+
+@graph_tool("listing devices")
+async def EID_listDevices(client: httpx.AsyncClient, headers: dict) -> DevicesResponse | ErrorResponse:
     """
     List all devices including Entra Joined, Entra Hybrid Joined, Registered, and Compliant Devices.
-    
+
     Returns:
         Dictionary containing list of devices with count and status.
     """
     logger.info("EID_listDevices called")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://graph.microsoft.com/v1.0/devices",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
+
+    url = "https://graph.microsoft.com/v1.0/devices"
+    if ijson is not None:
+        devices = await _stream_value_items(client, headers, url)
+    else:
+        response = await _graph_request(
+            client,
+            "GET",
+            url,
+            headers=headers
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
         devices = data.get("value", [])
-        return {
-            "status": "success",
-            "devices": devices,
-            "count": len(devices),
-            "message": json.dumps(devices, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error listing devices: {error}")
-        return {"status": "error", "message": f"Error listing devices: {str(error)}"}
+    return {
+        "status": "success",
+        "devices": devices,
+        "count": len(devices)
+    }
 
 
-async def EID_getDevice(device_id: str) -> dict[str, Any]:
+@graph_tool("getting device")
+async def EID_getDevice(client: httpx.AsyncClient, headers: dict, device_id: str) -> DeviceResponse | ErrorResponse:
     """
     Get a specific device by ID from Microsoft Graph API v1.0.
-    
+
     Args:
         device_id: The ID of the device
-        
+
     Returns:
         Dictionary containing device details or error message.
     """
     logger.info(f"EID_getDevice called: device_id={device_id}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/devices/{device_id}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
-        return {
-            "status": "success",
-            "device": data,
-            "message": json.dumps(data, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error getting device: {error}")
-        return {"status": "error", "message": f"Error getting device: {str(error)}"}
 
+    response = await _graph_request(
+        client,
+        "GET",
+        f"https://graph.microsoft.com/v1.0/devices/{device_id}",
+        headers=headers
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
 
-async def EID_getGroups(top: int = 100) -> dict[str, Any]:
+    return {
+        "status": "success",
+        "device": data
+    }
+
+
+@graph_tool("listing groups")
+async def EID_getGroups(client: httpx.AsyncClient, headers: dict, top: int = 100, fetch_all: bool = False) -> GroupsResponse | ErrorResponse:
     """
     List all groups from Microsoft Graph API v1.0.
-    
+
     Args:
         top: Maximum number of groups to return (default: 100, max: 999)
-        
+        fetch_all: Follow @odata.nextLink pages server-side and return
+            every group, ignoring top (default: False)
+
     Returns:
         Dictionary containing list of groups or error message.
     """
     logger.info(f"EID_getGroups called: top={top}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Limit top parameter
-        top = max(1, min(top, 999))
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/groups?$select=id,displayName,mail,description,groupTypes&$top={top}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
+
+    # Limit top parameter
+    top = max(1, min(top, 999))
+
+    url = "https://graph.microsoft.com/v1.0/groups"
+    params = {"$select": "id,displayName,mail,description,groupTypes", "$top": top}
+    if fetch_all:
+        groups = await _paginate(client, headers, url, params=params)
+        next_link = None
+    else:
+        response = await _graph_request(
+            client,
+            "GET",
+            url,
+            headers=headers,
+            params=params
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
         groups = data.get("value", [])
-        return {
-            "status": "success",
-            "groups": groups,
-            "count": len(groups),
-            "nextLink": data.get("@odata.nextLink"),
-            "message": json.dumps(groups, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error listing groups: {error}")
-        return {"status": "error", "message": f"Error listing groups: {str(error)}"}
+        next_link = data.get("@odata.nextLink")
+
+    return {
+        "status": "success",
+        "groups": groups,
+        "count": len(groups),
+        "nextLink": next_link
+    }
 
 
-async def EID_getGroup(group_id: str) -> dict[str, Any]:
+@graph_tool("getting group")
+async def EID_getGroup(client: httpx.AsyncClient, headers: dict, group_id: str) -> GroupResponse | ErrorResponse:
     """
     Get a specific group by ID from Microsoft Graph API v1.0.
-    
+
     Args:
         group_id: The ID of the group
-        
+
     Returns:
         Dictionary containing group details or error message.
     """
     logger.info(f"EID_getGroup called: group_id={group_id}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/groups/{group_id}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
-        return {
-            "status": "success",
-            "group": data,
-            "message": json.dumps(data, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error getting group: {error}")
-        return {"status": "error", "message": f"Error getting group: {str(error)}"}
+
+    response = await _graph_request(
+        client,
+        "GET",
+        f"https://graph.microsoft.com/v1.0/groups/{group_id}",
+        headers=headers
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
+
+    return {
+        "status": "success",
+        "group": data
+    }
 
 
-async def EID_getGroupMembers(group_id: str, top: int = 100) -> dict[str, Any]:
+@graph_tool("getting group members")
+async def EID_getGroupMembers(client: httpx.AsyncClient, headers: dict, group_id: str, top: int = 100, fetch_all: bool = False) -> GroupMembersResponse | ErrorResponse:
     """
     Get members of a specific group from Microsoft Graph API v1.0.
-    
+
     Args:
         group_id: The ID of the group
         top: Maximum number of members to return (default: 100, max: 999)
-        
+        fetch_all: Follow @odata.nextLink pages server-side and return
+            every member, ignoring top (default: False)
+
     Returns:
         Dictionary containing list of group members or error message.
     """
     logger.info(f"EID_getGroupMembers called: group_id={group_id}, top={top}")
-    
-    try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Limit top parameter
-        top = max(1, min(top, 999))
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/groups/{group_id}/members?$select=id,displayName,mail,userPrincipalName&$top={top}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-        
+
+    # Limit top parameter
+    top = max(1, min(top, 999))
+
+    url = f"https://graph.microsoft.com/v1.0/groups/{group_id}/members"
+    params = {"$select": "id,displayName,mail,userPrincipalName", "$top": top}
+    if fetch_all:
+        members = await _paginate(client, headers, url, params=params)
+        next_link = None
+    else:
+        response = await _graph_request(
+            client,
+            "GET",
+            url,
+            headers=headers,
+            params=params
+        )
+        response.raise_for_status()
+        data = _loads(response.content)
         members = data.get("value", [])
-        return {
-            "status": "success",
-            "members": members,
-            "count": len(members),
-            "group_id": group_id,
-            "nextLink": data.get("@odata.nextLink"),
-            "message": json.dumps(members, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error getting group members: {error}")
-        return {"status": "error", "message": f"Error getting group members: {str(error)}"}
+        next_link = data.get("@odata.nextLink")
 
+    return {
+        "status": "success",
+        "members": members,
+        "count": len(members),
+        "group_id": group_id,
+        "nextLink": next_link
+    }
 
-async def EID_searchGroups(query: str, top: int = 50) -> dict[str, Any]:
+
+@graph_tool("searching groups")
+async def EID_searchGroups(client: httpx.AsyncClient, headers: dict, query: str, top: int = 50) -> GroupSearchResponse | ErrorResponse:
     """
     Search for groups in Microsoft Graph API by display name.
-    
+
     Args:
         query: Search query string
         top: Maximum number of results to return (default: 50, max: 999)
-        
+
     Returns:
         Dictionary containing list of matching groups or error message.
     """
     logger.info(f"EID_searchGroups called: query={query}, top={top}")
-    
+
+    # Same advanced-query pattern as EID_searchUsers: indexed $search
+    # beats a startswith() scan and params= handles the encoding
+    headers = {**headers, "ConsistencyLevel": "eventual"}
+
+    # Limit top parameter
+    top = max(1, min(top, 999))
+
+    params = {
+        "$search": f'"displayName:{query}"',
+        "$select": "id,displayName,mail,description,groupTypes",
+        "$top": top,
+        "$count": "true",
+    }
+
+    response = await _graph_request(
+        client,
+        "GET",
+        "https://graph.microsoft.com/v1.0/groups",
+        headers=headers,
+        params=params
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
+
+    groups = data.get("value", [])
+    return {
+        "status": "success",
+        "groups": groups,
+        "count": len(groups),
+        "query": query
+    }
+
+
+async def _verify_group(
+    client: httpx.AsyncClient,
+    headers: dict,
+    group_id: str,
+    out: io.StringIO,
+) -> None:
+    """Re-fetch a freshly created group and its member count for the report."""
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Limit top parameter
-        top = max(1, min(top, 999))
-        
-        # Search groups using filter
-        filter_query = f"startswith(displayName,'{query}')"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://graph.microsoft.com/v1.0/groups?$filter={filter_query}&$select=id,displayName,mail,description,groupTypes&$top={top}",
-                headers=headers
+        verify_response = await _graph_request(
+            client,
+            "GET",
+            f"https://graph.microsoft.com/v1.0/groups/{group_id}",
+            headers=headers,
+            params={"$select": "id,displayName,description,mailEnabled,securityEnabled"}
+        )
+        verify_response.raise_for_status()
+
+        # Get member count via /$count: a bare integer instead of
+        # fetching and parsing every member row just to len() it
+        try:
+            count_response = await _graph_request(
+                client,
+                "GET",
+                f"https://graph.microsoft.com/v1.0/groups/{group_id}/members/$count",
+                headers={**headers, "ConsistencyLevel": "eventual"}
             )
-            response.raise_for_status()
-            data = response.json()
-        
-        groups = data.get("value", [])
-        return {
-            "status": "success",
-            "groups": groups,
-            "count": len(groups),
-            "query": query,
-            "message": json.dumps(groups, indent=2)
-        }
-    except Exception as error:
-        logger.error(f"Error searching groups: {error}")
-        return {"status": "error", "message": f"Error searching groups: {str(error)}"}
+            count_response.raise_for_status()
+            out.write(f"   Total members: {int(count_response.text)}\n")
+        except Exception:
+            out.write("   Total members: Unable to retrieve\n")
+    except Exception as verify_error:
+        out.write(f"   Could not verify group status: {str(verify_error)}\n")
 
 
+@graph_tool("in EID_createUserGroups")
 async def EID_createUserGroups(
+    client: httpx.AsyncClient,
+    headers: dict,
     groupName: str,
     description: Optional[str] = None,
     userIds: Optional[List[str]] = None,
     groupIds: Optional[List[str]] = None,
     mailEnabled: bool = False,
-    addPrefix: bool = False
+    addPrefix: bool = False,
+    verify: bool = False
 ) -> dict[str, Any]:
     """
     Create and manage Entra ID security groups with users and nested groups.
-    
+
     This tool creates static membership security groups in Microsoft Entra ID, with support for
     adding both user members and nested groups. Groups can be configured as mail-enabled or
     security-only, making them suitable for various enterprise identity scenarios including
     access control, application assignments, and governance policies.
-    
+
     Args:
         groupName: Name for the group (optionally prefixed based on addPrefix parameter)
         description: Description of the group's purpose and membership
@@ -425,64 +736,52 @@ async def EID_createUserGroups(
         groupIds: Array of group object IDs to add as nested groups
         mailEnabled: Whether the group is mail-enabled (default: False for security groups)
         addPrefix: Whether to add 'POC-' prefix to group name for testing environments (default: False)
-        
+        verify: Re-fetch the group and member count from Graph after
+            creation; the default trusts the create/add responses and
+            skips the extra round trips (default: False)
+
     Returns:
         Dictionary with detailed creation results including group ID, member counts, and any errors.
     """
     logger.info(f"EID_createUserGroups called: groupName={groupName}")
-    
+
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
-        
-        if not token:
-            return {"status": "error", "message": "Authentication token not available. Authentication may be disabled or failed."}
-        
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-        
-        results = []
-        results.append("╔════════════════════════════════════════════════════════════════╗")
-        results.append("║  Entra ID Group Creation                                       ║")
-        results.append("╚════════════════════════════════════════════════════════════════╝")
-        results.append("")
-        
+        headers = {**headers, "Content-Type": "application/json"}
+
+        # Build the narrative report in a StringIO buffer: one growing
+        # text stream instead of hundreds of list appends plus a final
+        # O(N) join, and no cosmetic banner art inflating the payload
+        out = io.StringIO()
+        out.write("Entra ID Group Creation\n\n")
+
         # Add prefix only if explicitly requested
         if addPrefix and not groupName.startswith("POC-"):
             final_group_name = f"POC-{groupName}"
         else:
             final_group_name = groupName
-        
+
         # Initialize lists if None
         if userIds is None:
             userIds = []
         if groupIds is None:
             groupIds = []
-        
+
         # Validate inputs
         total_members = len(userIds) + len(groupIds)
         if total_members == 0:
-            results.append("⚠️  Warning: No members specified. Creating empty group.")
-            results.append("   You can add members later via Azure Portal or API.")
-            results.append("")
-        
+            out.write("Warning: no members specified; creating an empty group.\n\n")
+
         if total_members > 100:
-            results.append("⚠️  Warning: Adding more than 100 members may take a while")
-            results.append("")
-        
+            out.write("Warning: adding more than 100 members may take a while\n\n")
+
         # ========================================================================
         # STEP 1: Create the Group
         # ========================================================================
-        results.append("📋 Step 1: Creating Security Group")
-        results.append(f"   Group Name: {final_group_name}")
-        results.append(f"   Mail Enabled: {mailEnabled}")
-        results.append("   Security Enabled: true")
-        results.append("")
-        
+        out.write(f"Step 1: Creating security group '{final_group_name}' (mailEnabled={mailEnabled})\n")
+
         # Create mail nickname (alphanumeric only, max 64 chars)
-        mail_nickname = ''.join(c for c in final_group_name if c.isalnum()).lower()[:64]
-        if not mail_nickname:
-            mail_nickname = "pocgroup"
-        
+        mail_nickname = _NONALNUM.sub("", final_group_name).lower()[:64] or "pocgroup"
+
         group_body = {
             "displayName": final_group_name,
             "description": description or f"Security group - {final_group_name}",
@@ -491,179 +790,129 @@ async def EID_createUserGroups(
             "securityEnabled": True,
             "groupTypes": []  # Static membership
         }
-        
-        results.append("🔄 Creating group via Microsoft Graph API...")
-        
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            group_response = await client.post(
-                "https://graph.microsoft.com/v1.0/groups",
-                headers=headers,
-                json=group_body
-            )
-            group_response.raise_for_status()
-            group_data = group_response.json()
-        
+
+        group_response = await _graph_request(
+            client,
+            "POST",
+            "https://graph.microsoft.com/v1.0/groups",
+            headers=headers,
+            json=group_body
+        )
+        group_response.raise_for_status()
+        group_data = _loads(group_response.content)
+
         group_id = group_data["id"]
-        
-        results.append("✅ Group created successfully!")
-        results.append("")
-        results.append("📊 Group Details:")
-        results.append(f"   Group ID: {group_id}")
-        results.append(f"   Display Name: {group_data['displayName']}")
-        results.append(f"   Mail Nickname: {group_data['mailNickname']}")
-        results.append("")
-        
+
+        out.write(
+            f"Group created: id={group_id}, displayName={group_data['displayName']}, "
+            f"mailNickname={group_data['mailNickname']}\n\n"
+        )
+
+        # Member additions go through Graph $batch: up to 20 adds share a
+        # single HTTP round-trip instead of one POST per member
+        def _member_batch_requests(ref_urls: List[str]) -> List[dict]:
+            return [
+                {
+                    "id": str(i),
+                    "method": "POST",
+                    "url": f"/groups/{group_id}/members/$ref",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": {"@odata.id": ref_url},
+                }
+                for i, ref_url in enumerate(ref_urls)
+            ]
+
         # ========================================================================
         # STEP 2: Add User Members
         # ========================================================================
         added_users = []
         failed_users = []
-        
+
         if userIds and len(userIds) > 0:
-            results.append("📋 Step 2: Adding User Members")
-            results.append(f"   Number of users to add: {len(userIds)}")
-            results.append("")
-            
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                for i, user_id in enumerate(userIds):
-                    try:
-                        results.append(f"   [{i + 1}/{len(userIds)}] Adding user: {user_id}")
-                        
-                        member_response = await client.post(
-                            f"https://graph.microsoft.com/v1.0/groups/{group_id}/members/$ref",
-                            headers=headers,
-                            json={"@odata.id": f"https://graph.microsoft.com/v1.0/users/{user_id}"}
-                        )
-                        member_response.raise_for_status()
-                        
-                        added_users.append(user_id)
-                        
-                        # Add small delay to avoid throttling
-                        if i < len(userIds) - 1:
-                            await asyncio.sleep(0.1)
-                    except Exception as error:
-                        error_msg = str(error)
-                        results.append(f"      ❌ Failed: {error_msg}")
-                        failed_users.append({"userId": user_id, "error": error_msg})
-            
-            results.append("")
-            results.append("📊 User Addition Summary:")
-            results.append(f"   Successfully added: {len(added_users)}")
-            results.append(f"   Failed: {len(failed_users)}")
-            
-            if failed_users:
-                results.append("")
-                results.append("⚠️  Failed Users:")
-                for item in failed_users:
-                    results.append(f"   - {item['userId']}: {item['error']}")
-            results.append("")
-        
+            out.write(f"Step 2: Adding {len(userIds)} user members\n")
+
+            sub_responses = await _graph_batch(
+                client,
+                headers,
+                _member_batch_requests(
+                    [f"https://graph.microsoft.com/v1.0/users/{user_id}" for user_id in userIds]
+                ),
+            )
+            for i, user_id in enumerate(userIds):
+                sub_response = sub_responses[i] if i < len(sub_responses) else None
+                if sub_response and 200 <= sub_response.get("status", 0) < 300:
+                    added_users.append(user_id)
+                else:
+                    failed_users.append({"userId": user_id, "error": _batch_error(sub_response)})
+
+            out.write(f"   Added: {len(added_users)}, failed: {len(failed_users)}\n")
+            for item in failed_users:
+                out.write(f"   - {item['userId']}: {item['error']}\n")
+            out.write("\n")
+
         # ========================================================================
         # STEP 3: Add Group Members (Nested Groups)
         # ========================================================================
         added_groups = []
         failed_groups = []
-        
+
         if groupIds and len(groupIds) > 0:
             step_num = 3 if userIds and len(userIds) > 0 else 2
-            results.append(f"📋 Step {step_num}: Adding Nested Groups")
-            results.append(f"   Number of groups to add: {len(groupIds)}")
-            results.append("")
-            
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                for i, nested_group_id in enumerate(groupIds):
-                    try:
-                        results.append(f"   [{i + 1}/{len(groupIds)}] Adding group: {nested_group_id}")
-                        
-                        member_response = await client.post(
-                            f"https://graph.microsoft.com/v1.0/groups/{group_id}/members/$ref",
-                            headers=headers,
-                            json={"@odata.id": f"https://graph.microsoft.com/v1.0/groups/{nested_group_id}"}
-                        )
-                        member_response.raise_for_status()
-                        
-                        added_groups.append(nested_group_id)
-                        
-                        # Add small delay to avoid throttling
-                        if i < len(groupIds) - 1:
-                            await asyncio.sleep(0.1)
-                    except Exception as error:
-                        error_msg = str(error)
-                        results.append(f"      ❌ Failed: {error_msg}")
-                        failed_groups.append({"groupId": nested_group_id, "error": error_msg})
-            
-            results.append("")
-            results.append("📊 Group Addition Summary:")
-            results.append(f"   Successfully added: {len(added_groups)}")
-            results.append(f"   Failed: {len(failed_groups)}")
-            
-            if failed_groups:
-                results.append("")
-                results.append("⚠️  Failed Groups:")
-                for item in failed_groups:
-                    results.append(f"   - {item['groupId']}: {item['error']}")
-            results.append("")
-        
+            out.write(f"Step {step_num}: Adding {len(groupIds)} nested groups\n")
+
+            sub_responses = await _graph_batch(
+                client,
+                headers,
+                _member_batch_requests(
+                    [
+                        f"https://graph.microsoft.com/v1.0/groups/{nested_group_id}"
+                        for nested_group_id in groupIds
+                    ]
+                ),
+            )
+            for i, nested_group_id in enumerate(groupIds):
+                sub_response = sub_responses[i] if i < len(sub_responses) else None
+                if sub_response and 200 <= sub_response.get("status", 0) < 300:
+                    added_groups.append(nested_group_id)
+                else:
+                    failed_groups.append({"groupId": nested_group_id, "error": _batch_error(sub_response)})
+
+            out.write(f"   Added: {len(added_groups)}, failed: {len(failed_groups)}\n")
+            for item in failed_groups:
+                out.write(f"   - {item['groupId']}: {item['error']}\n")
+            out.write("\n")
+
         # ========================================================================
-        # STEP 4: Verify Group Status
+        # STEP 4: Verify Group Status (opt-in)
         # ========================================================================
-        step_num = 1
-        if userIds and len(userIds) > 0:
-            step_num += 1
-        if groupIds and len(groupIds) > 0:
+        # The create and member-add responses already carry everything
+        # the summary needs; re-fetching the group and member count adds
+        # two round trips for no new information on the success path
+        if verify:
+            step_num = 1
+            if userIds and len(userIds) > 0:
+                step_num += 1
+            if groupIds and len(groupIds) > 0:
+                step_num += 1
             step_num += 1
-        step_num += 1
-        
-        results.append(f"📋 Step {step_num}: Verifying Group Status")
-        
-        try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                verify_response = await client.get(
-                    f"https://graph.microsoft.com/v1.0/groups/{group_id}?$select=id,displayName,description,mailEnabled,securityEnabled",
-                    headers=headers
-                )
-                verify_response.raise_for_status()
-                
-                # Get member count
-                try:
-                    members_response = await client.get(
-                        f"https://graph.microsoft.com/v1.0/groups/{group_id}/members?$select=id",
-                        headers=headers
-                    )
-                    members_response.raise_for_status()
-                    members_data = members_response.json()
-                    results.append(f"   Total members: {len(members_data.get('value', []))}")
-                except Exception:
-                    results.append("   Total members: Unable to retrieve")
-        except Exception as verify_error:
-            results.append(f"   ⚠️  Could not verify group status: {str(verify_error)}")
-        
+
+            out.write(f"Step {step_num}: Verifying group status\n")
+
+            await _verify_group(client, headers, group_id, out)
+        else:
+            out.write(f"   Total members: {len(added_users) + len(added_groups)}\n")
+
         # ========================================================================
         # SUCCESS SUMMARY
         # ========================================================================
-        results.append("")
-        results.append("╔════════════════════════════════════════════════════════════════╗")
-        results.append("║  ✅ GROUP CREATION COMPLETE                                    ║")
-        results.append("╚════════════════════════════════════════════════════════════════╝")
-        results.append("")
-        results.append("📱 Group Information:")
-        results.append(f"   Group ID: {group_id}")
-        results.append(f"   Display Name: {final_group_name}")
-        results.append("   Type: Security Group (Static Membership)")
-        results.append(f"   Users Added: {len(added_users)}{f' ({len(failed_users)} failed)' if failed_users else ''}")
-        results.append(f"   Groups Added: {len(added_groups)}{f' ({len(failed_groups)} failed)' if failed_groups else ''}")
-        results.append("")
-        results.append("🔗 Useful Links:")
-        results.append(f"   View in Azure Portal: https://portal.azure.com/#view/Microsoft_AAD_IAM/GroupDetailsMenuBlade/~/Overview/groupId/{group_id}")
-        results.append(f"   Manage members: https://portal.azure.com/#view/Microsoft_AAD_IAM/GroupDetailsMenuBlade/~/Members/groupId/{group_id}")
-        results.append("")
-        results.append("📚 Next Steps:")
-        results.append("   1. Assign Entra ID roles to this group")
-        results.append("   2. Use group in Conditional Access policies")
-        results.append("   3. Assign applications to the group")
-        results.append("   4. Configure group-based licensing")
-        results.append("   5. Set up dynamic membership rules if needed")
-        
+        out.write(
+            f"\nGroup creation complete: {final_group_name} ({group_id})\n"
+            f"   Users added: {len(added_users)}/{len(userIds)}\n"
+            f"   Groups added: {len(added_groups)}/{len(groupIds)}\n"
+            "   View in Azure Portal: https://portal.azure.com/#view/Microsoft_AAD_IAM/"
+            f"GroupDetailsMenuBlade/~/Overview/groupId/{group_id}\n"
+        )
+
         # Return JSON response
         response = {
             "success": len(failed_users) == 0 and len(failed_groups) == 0,
@@ -691,38 +940,23 @@ async def EID_createUserGroups(
                 "groups": failed_groups if failed_groups else None
             }
         }
-        
-        results.append("")
-        results.append("📄 JSON Response:")
-        results.append(json.dumps(response, indent=2))
-        
+
         return {
             "status": "success",
-            "message": '\n'.join(results),
+            "message": out.getvalue(),
             "data": response
         }
-        
+
     except Exception as error:
-        results = []
-        results.append("")
-        results.append("╔════════════════════════════════════════════════════════════════╗")
-        results.append("║  ❌ ERROR OCCURRED                                             ║")
-        results.append("╚════════════════════════════════════════════════════════════════╝")
-        results.append(f"Error: {str(error)}")
-        
-        # Return error in JSON format
-        results.append("")
-        results.append("📄 Error Response:")
         error_response = {
             "success": False,
             "error": str(error)
         }
-        results.append(json.dumps(error_response, indent=2))
-        
+
         logger.error(f"Error in EID_createUserGroups: {error}")
-        
+
         return {
             "status": "error",
-            "message": '\n'.join(results),
+            "message": f"Error: {str(error)}",
             "data": error_response
         }
@@ -9,9 +9,11 @@ Dependencies:
 - getset_pox_mcp.authentication.middleware: For authentication token management
 """
 
+from importlib.util import find_spec
 from typing import Any, Optional
 from getset_pox_mcp.logging_config import get_logger
 from getset_pox_mcp.authentication.middleware import get_auth_middleware
+import asyncio
 import httpx
 import json
 from datetime import datetime, timezone
@@ -20,11 +22,180 @@ import time
 
 logger = get_logger(__name__)
 
+# orjson (Rust) decodes straight from bytes and encodes request bodies
+# faster than the stdlib json httpx uses internally; fall back to the
+# stdlib when the optional dependency is absent
+try:
+    import orjson
+
+    def _loads(response: httpx.Response) -> Any:
+        return orjson.loads(response.content) if response.content else {}
+
+    def _json_content(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(response: httpx.Response) -> Any:
+        return json.loads(response.content) if response.content else {}
+
+    def _json_content(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# ijson parses collection pages incrementally off the wire, avoiding
+# the raw-bytes-plus-DOM double buffering; optional like orjson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Entitlement Management endpoints and headers are invariant across
+# calls; build the pieces once instead of re-spelling the literals in
+# every function
+_IGA_BASE = "https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement"
+_GRAPH_V1 = "https://graph.microsoft.com/v1.0"
+_GRAPH_BETA = "https://graph.microsoft.com/beta"
+
+
+async def _stream_page(
+    client: httpx.AsyncClient,
+    headers: dict,
+    url: str,
+    params: Optional[dict] = None,
+) -> tuple[list, Optional[str], Optional[str]]:
+    """
+    Stream one Graph collection page, returning (items, nextLink, etag).
+
+    Feeds the body into ijson as bytes arrive instead of buffering the
+    whole response before parsing; requires ijson to be importable.
+    """
+    items: list = []
+    next_link: Optional[str] = None
+    async with client.stream("GET", url, headers=headers, params=params) as response:
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        async for key, value in ijson.kvitems(response.aiter_bytes(), ""):
+            if key == "value":
+                items = value
+            elif key == "@odata.nextLink":
+                next_link = value
+    return items, next_link, etag
+
+
+# Validated-token memo, as in the EID service: reuse a token for up to
+# four minutes — well under any real token lifetime — so bulk loops do
+# not pay the middleware hop per HTTP call
+_token_cache: dict[str, Any] = {"value": None, "exp": 0.0}
+
+
+async def _cached_token() -> Optional[str]:
+    """Return a recently validated token, consulting the middleware on miss."""
+    now = time.monotonic()
+    if _token_cache["value"] and _token_cache["exp"] - now > 30:
+        return _token_cache["value"]
+    token = await get_auth_middleware().get_valid_token()
+    if token:
+        _token_cache["value"] = token
+        _token_cache["exp"] = now + 240
+    return token
+
+
+def _auth_headers(token: str, extra: Optional[dict] = None) -> dict:
+    """Bearer plus JSON headers for Graph calls, with optional extras."""
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    if extra:
+        headers.update(extra)
+    return headers
+
+# Process-wide client: connections, TLS sessions, and DNS lookups are
+# reused across IGA calls instead of a fresh handshake per invocation
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _CLIENT
+
+
+async def aclose_client() -> None:
+    """Close the shared client; call from server shutdown or tests."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# Conditional-GET memo: Graph returns ETags for rarely changing
+# collections like access packages and catalog resources; replaying the
+# tag via If-None-Match turns an unchanged re-pull into a bodyless 304.
+# Entries hold (etag, items, nextLink) keyed by URL plus query options.
+_etag_cache: dict[Any, tuple[str, list, Optional[str]]] = {}
+
+
+def _etag_key(url: str, params: Optional[dict]) -> Any:
+    return (url, tuple(sorted(params.items())) if params else None)
+
+
+def _err(
+    message: str,
+    *,
+    step: Optional[str] = None,
+    status_code: Optional[int] = None,
+    correlation_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Shape an error response from one shared literal.
+
+    Building every error through the same code path keeps the key
+    strings interned and the dict layout identical, which CPython's
+    adaptive specialization rewards on the hot paths.
+    """
+    response: dict[str, Any] = {"status": "error", "message": message}
+    if step is not None:
+        response["step"] = step
+    if status_code is not None:
+        response["statusCode"] = status_code
+    if correlation_id is not None:
+        response["correlationId"] = correlation_id
+    return response
+
+
+def _make_validator(*names: str):
+    """
+    Build a required-non-empty-string validator at import time.
+
+    The per-parameter error messages are precomputed once, so each call
+    pays a single zip loop instead of re-formatting strings and
+    repeating isinstance branches inline in every function.
+    """
+    messages = tuple(f"{name} is required and must be a non-empty string" for name in names)
+
+    def validate(*values: Any) -> Optional[dict[str, Any]]:
+        for value, message in zip(values, messages):
+            if not value or not isinstance(value, str):
+                return _err(message)
+        return None
+
+    return validate
+
+
+_validate_create_catalog = _make_validator("displayName", "description")
+_validate_create_package = _make_validator("catalogId", "displayName")
+_validate_add_resource = _make_validator("catalogId", "accessPackageId", "groupObjectId")
+
 
 async def IGA_listAccessPackages(
     select: Optional[str] = None,
     filter: Optional[str] = None,
-    expand: Optional[str] = None
+    expand: Optional[str] = None,
+    fetch_all: bool = False
 ) -> dict[str, Any]:
     """
     Retrieves all access packages from Microsoft Entra ID's Entitlement Management.
@@ -35,6 +206,7 @@ async def IGA_listAccessPackages(
         select: OData $select query to return specific properties (e.g., "id,displayName,description")
         filter: OData $filter query to narrow results (e.g., "contains(tolower(displayName),'team')")
         expand: OData $expand query to include related entities (e.g., "accessPackageCatalog")
+        fetch_all: Follow @odata.nextLink pages server-side and return every package (default: False)
         
     Returns:
         Dictionary containing collection of accessPackage objects or error message.
@@ -42,45 +214,66 @@ async def IGA_listAccessPackages(
     logger.info("IGA_listAccessPackages called")
     
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
+        token = await _cached_token()
         
         if not token:
-            return {"status": "error", "message": "Authentication token not available."}
-        
-        # Build query URL
-        base_url = "https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement/accessPackages"
-        query_params = []
+            return _err("Authentication token not available.")
         
-        if select:
-            query_params.append(f"$select={select}")
-        if filter:
-            query_params.append(f"$filter={filter}")
-        if expand:
-            query_params.append(f"$expand={expand}")
-        
-        url = base_url if not query_params else f"{base_url}?{'&'.join(query_params)}"
-        
-        headers = {"Authorization": f"Bearer {token}"}
+        # OData options ride in params= so httpx URL-encodes them once
+        # (the old f-string concatenation dropped escaping entirely);
+        # the bare no-option call skips the dict build altogether
+        url = f"{_IGA_BASE}/accessPackages"
+        params = None
+        if select or filter or expand:
+            params = {
+                k: v
+                for k, v in (("$select", select), ("$filter", filter), ("$expand", expand))
+                if v
+            }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=60.0)
-            response.raise_for_status()
-            data = response.json()
+        headers = _auth_headers(token)
         
-        access_packages = data.get("value", [])
+        client = _get_client()
+        access_packages: list = []
+        page_url: Optional[str] = url
+        page_params = params
+        next_link: Optional[str] = None
+        while page_url:
+            key = _etag_key(page_url, page_params)
+            cached = _etag_cache.get(key)
+            request_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+            if cached or ijson is None:
+                # With an ETag on hand a buffered conditional GET beats
+                # streaming: an unchanged page costs no body at all
+                response = await client.get(page_url, headers=request_headers, params=page_params)
+                if cached and response.status_code == 304:
+                    items, next_link = cached[1], cached[2]
+                else:
+                    response.raise_for_status()
+                    data = _loads(response)
+                    items = data.get("value", [])
+                    next_link = data.get("@odata.nextLink")
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        _etag_cache[key] = (etag, items, next_link)
+            else:
+                items, next_link, etag = await _stream_page(client, headers, page_url, page_params)
+                if etag:
+                    _etag_cache[key] = (etag, items, next_link)
+            access_packages.extend(items)
+            # nextLink is a complete URL; page-one params must not repeat
+            page_url, page_params = (next_link, None) if fetch_all else (None, None)
         
         return {
             "status": "success",
             "accessPackages": access_packages,
             "count": len(access_packages),
-            "nextLink": data.get("@odata.nextLink"),
-            "message": json.dumps(access_packages, indent=2)
+            "nextLink": None if fetch_all else next_link
         }
         
     except Exception as error:
         logger.error(f"Error listing access packages: {error}")
-        return {"status": "error", "message": f"Error listing access packages: {str(error)}"}
+        return _err(f"Error listing access packages: {str(error)}")
 
 
 async def IGA_createAccessCatalog(
@@ -106,27 +299,24 @@ async def IGA_createAccessCatalog(
     logger.info(f"IGA_createAccessCatalog called: {displayName}")
     
     # Input validation
-    if not displayName or not isinstance(displayName, str):
-        return {"status": "error", "message": "displayName is required and must be a non-empty string"}
-    
-    if not description or not isinstance(description, str):
-        return {"status": "error", "message": "description is required and must be a non-empty string"}
+    validation_error = _validate_create_catalog(displayName, description)
+    if validation_error:
+        return validation_error
     
     if state not in ["published", "unpublished"]:
-        return {"status": "error", "message": "state must be either 'published' or 'unpublished'"}
+        return _err("state must be either 'published' or 'unpublished'")
     
     if not isinstance(isExternallyVisible, bool):
-        return {"status": "error", "message": "isExternallyVisible must be a boolean value"}
+        return _err("isExternallyVisible must be a boolean value")
     
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
+        token = await _cached_token()
         
         if not token:
-            return {"status": "error", "message": "Authentication token not available."}
+            return _err("Authentication token not available.")
         
-        url = "https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement/catalogs"
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        url = f"{_IGA_BASE}/catalogs"
+        headers = _auth_headers(token)
         
         request_body = {
             "displayName": displayName,
@@ -135,33 +325,28 @@ async def IGA_createAccessCatalog(
             "isExternallyVisible": isExternallyVisible
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=request_body, timeout=60.0)
-            
-            if response.status_code == 201:
-                catalog_data = response.json()
-                logger.info(f"Successfully created access catalog with ID: {catalog_data.get('id')}")
-                
-                return {
-                    "status": "success",
-                    "catalog": catalog_data,
-                    "message": f"Access catalog '{displayName}' created successfully",
-                    "catalogId": catalog_data.get("id"),
-                    "details": json.dumps(catalog_data, indent=2)
-                }
-            else:
-                error_data = response.json() if response.text else {}
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                return {
-                    "status": "error",
-                    "message": f"Failed to create catalog: {error_message}",
-                    "statusCode": response.status_code
-                }
+        client = _get_client()
+        response = await client.post(url, headers=headers, content=_json_content(request_body))
+
+        if response.status_code == 201:
+            catalog_data = _loads(response)
+            logger.info(f"Successfully created access catalog with ID: {catalog_data.get('id')}")
+
+            return {
+                "status": "success",
+                "catalog": catalog_data,
+                "message": f"Access catalog '{displayName}' created successfully",
+                "catalogId": catalog_data.get("id")
+            }
+        else:
+            error_data = _loads(response)
+            error_message = error_data.get("error", {}).get("message", "Unknown error")
+
+            return _err(f"Failed to create catalog: {error_message}", status_code=response.status_code)
         
     except Exception as error:
         logger.error(f"Error creating access catalog: {error}")
-        return {"status": "error", "message": f"Error creating access catalog: {str(error)}"}
+        return _err(f"Error creating access catalog: {str(error)}")
 
 
 async def IGA_createAccessPackage(
@@ -185,21 +370,18 @@ async def IGA_createAccessPackage(
     logger.info(f"IGA_createAccessPackage called: {displayName}")
     
     # Input validation
-    if not catalogId or not isinstance(catalogId, str):
-        return {"status": "error", "message": "catalogId is required and must be a non-empty string"}
-    
-    if not displayName or not isinstance(displayName, str):
-        return {"status": "error", "message": "displayName is required and must be a non-empty string"}
+    validation_error = _validate_create_package(catalogId, displayName)
+    if validation_error:
+        return validation_error
     
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
+        token = await _cached_token()
         
         if not token:
-            return {"status": "error", "message": "Authentication token not available."}
+            return _err("Authentication token not available.")
         
-        url = "https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement/accessPackages"
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        url = f"{_IGA_BASE}/accessPackages"
+        headers = _auth_headers(token)
         
         request_body = {
             "catalog": {"id": catalogId},
@@ -209,34 +391,29 @@ async def IGA_createAccessPackage(
         if description is not None:
             request_body["description"] = description
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=request_body, timeout=60.0)
-            
-            if response.status_code == 201:
-                package_data = response.json()
-                logger.info(f"Successfully created access package with ID: {package_data.get('id')}")
-                
-                return {
-                    "status": "success",
-                    "accessPackage": package_data,
-                    "message": f"Access package '{displayName}' created successfully",
-                    "accessPackageId": package_data.get("id"),
-                    "catalogId": catalogId,
-                    "details": json.dumps(package_data, indent=2)
-                }
-            else:
-                error_data = response.json() if response.text else {}
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                return {
-                    "status": "error",
-                    "message": f"Failed to create access package: {error_message}",
-                    "statusCode": response.status_code
-                }
+        client = _get_client()
+        response = await client.post(url, headers=headers, content=_json_content(request_body))
+
+        if response.status_code == 201:
+            package_data = _loads(response)
+            logger.info(f"Successfully created access package with ID: {package_data.get('id')}")
+
+            return {
+                "status": "success",
+                "accessPackage": package_data,
+                "message": f"Access package '{displayName}' created successfully",
+                "accessPackageId": package_data.get("id"),
+                "catalogId": catalogId
+            }
+        else:
+            error_data = _loads(response)
+            error_message = error_data.get("error", {}).get("message", "Unknown error")
+
+            return _err(f"Failed to create access package: {error_message}", status_code=response.status_code)
         
     except Exception as error:
         logger.error(f"Error creating access package: {error}")
-        return {"status": "error", "message": f"Error creating access package: {str(error)}"}
+        return _err(f"Error creating access package: {str(error)}")
 
 
 async def IGA_addResourceGrouptoPackage(
@@ -262,173 +439,268 @@ async def IGA_addResourceGrouptoPackage(
     logger.info(f"IGA_addResourceGrouptoPackage called: group={groupObjectId}")
     
     # Input validation
-    if not catalogId or not isinstance(catalogId, str):
-        return {"status": "error", "message": "catalogId is required and must be a non-empty string"}
-    
-    if not accessPackageId or not isinstance(accessPackageId, str):
-        return {"status": "error", "message": "accessPackageId is required and must be a non-empty string"}
-    
-    if not groupObjectId or not isinstance(groupObjectId, str):
-        return {"status": "error", "message": "groupObjectId is required and must be a non-empty string"}
+    validation_error = _validate_add_resource(catalogId, accessPackageId, groupObjectId)
+    if validation_error:
+        return validation_error
     
     try:
-        auth_middleware = get_auth_middleware()
-        token = await auth_middleware.get_valid_token()
+        token = await _cached_token()
         
         if not token:
-            return {"status": "error", "message": "Authentication token not available."}
+            return _err("Authentication token not available.")
         
         correlation_id = str(uuid.uuid4())
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "x-correlation-id": correlation_id
-        }
+        headers = _auth_headers(token, {"x-correlation-id": correlation_id})
         
         logger.info(f"Starting group resource addition - Correlation ID: {correlation_id}")
         
-        async with httpx.AsyncClient() as client:
-            # Step 1: Add the Group to the Catalog
-            logger.info(f"Step 1: Adding group {groupObjectId} to catalog {catalogId}")
-            
-            resource_request_url = "https://graph.microsoft.com/beta/identityGovernance/entitlementManagement/accessPackageResourceRequests"
-            resource_request_payload = {
-                "catalogId": catalogId,
-                "requestType": "AdminAdd",
-                "justification": f"Adding group resource via IGA Tool - Correlation ID: {correlation_id}",
-                "accessPackageResource": {
-                    "resourceType": "AadGroup",
-                    "originId": groupObjectId,
-                    "originSystem": "AadGroup"
-                }
+        client = _get_client()
+        # Steps 1+2: one $batch round trip runs the resource-request
+        # POST and the dependent resource lookup GET with dependsOn
+        # ordering (beta $batch, since the resource request lives on
+        # the beta endpoint)
+        logger.info(f"Step 1: Adding group {groupObjectId} to catalog {catalogId}")
+
+        resource_request_payload = {
+            "catalogId": catalogId,
+            "requestType": "AdminAdd",
+            "justification": f"Adding group resource via IGA Tool - Correlation ID: {correlation_id}",
+            "accessPackageResource": {
+                "resourceType": "AadGroup",
+                "originId": groupObjectId,
+                "originSystem": "AadGroup"
             }
-            
-            response = await client.post(resource_request_url, headers=headers, json=resource_request_payload, timeout=60.0)
-            
-            if response.status_code == 201:
-                logger.info(f"✅ Step 1 completed: Group added to catalog successfully")
-            elif response.status_code == 409:
-                logger.info(f"ℹ️ Step 1: Group already exists in catalog, proceeding to step 2")
-            else:
-                error_data = response.json() if response.text else {}
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                return {
-                    "status": "error",
-                    "step": "add_to_catalog",
-                    "message": f"Failed to add group to catalog: {error_message}",
-                    "statusCode": response.status_code,
-                    "correlationId": correlation_id
+        }
+        resources_path = f"/identityGovernance/entitlementManagement/catalogs/{catalogId}/accessPackageResources?$filter=originId eq '{groupObjectId}'"
+        batch_payload = {
+            "requests": [
+                {
+                    "id": "1",
+                    "method": "POST",
+                    "url": "/identityGovernance/entitlementManagement/accessPackageResourceRequests",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": resource_request_payload
+                },
+                {
+                    "id": "2",
+                    "method": "GET",
+                    "url": resources_path,
+                    "dependsOn": ["1"]
                 }
-            
-            # Wait for resource processing
-            await asyncio.sleep(3)
-            
-            # Step 2: Get the resource ID from catalog
-            logger.info(f"Step 2: Retrieving resource ID for group {groupObjectId}")
-            
-            catalog_resources_url = f"https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement/catalogs/{catalogId}/accessPackageResources?$filter=originId eq '{groupObjectId}'"
-            
-            resources_response = await client.get(catalog_resources_url, headers=headers, timeout=60.0)
-            
+            ]
+        }
+
+        batch_response = await client.post(f"{_GRAPH_BETA}/$batch", headers=headers, content=_json_content(batch_payload))
+        batch_response.raise_for_status()
+        responses_by_id = {r.get("id"): r for r in _loads(batch_response).get("responses", [])}
+
+        post_result = responses_by_id.get("1", {})
+        post_status = post_result.get("status")
+        if post_status == 201:
+            logger.info(f"✅ Step 1 completed: Group added to catalog successfully")
+        elif post_status == 409:
+            logger.info(f"ℹ️ Step 1: Group already exists in catalog, proceeding to step 2")
+        else:
+            error_message = (post_result.get("body") or {}).get("error", {}).get("message", "Unknown error")
+
+            return _err(
+                f"Failed to add group to catalog: {error_message}",
+                step="add_to_catalog",
+                status_code=post_status,
+                correlation_id=correlation_id,
+            )
+
+        # Graph advertises the resource-request status endpoint in the
+        # sub-response Location header; poll it briefly and move on as
+        # soon as delivery completes rather than assuming a fixed delay
+        status_url = (post_result.get("headers") or {}).get("Location")
+        if status_url:
+            for delay in (0.1, 0.2, 0.4, 0.8, 1.6):
+                status_response = await client.get(status_url, headers=headers)
+                if status_response.status_code == 200:
+                    request_state = _loads(status_response).get("requestState")
+                    if request_state in ("Delivered", "PartiallyDelivered"):
+                        break
+                await asyncio.sleep(delay)
+
+        # Step 2: the batched GET usually already carries the resource;
+        # if provisioning has not caught up yet, poll with short backoff
+        # instead of a fixed 3-second sleep
+        logger.info(f"Step 2: Retrieving resource ID for group {groupObjectId}")
+
+        get_result = responses_by_id.get("2", {})
+        resources = []
+        if get_result.get("status") == 200:
+            resources = (get_result.get("body") or {}).get("value", [])
+
+        catalog_resources_url = f"{_GRAPH_V1}{resources_path}"
+
+        resources_key = _etag_key(catalog_resources_url, None)
+
+        for delay in (0.2, 0.5, 1.0, 2.0):
+            if resources:
+                break
+            await asyncio.sleep(delay)
+
+            cached = _etag_cache.get(resources_key)
+            poll_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+            resources_response = await client.get(catalog_resources_url, headers=poll_headers)
+
+            if cached and resources_response.status_code == 304:
+                # Same group already resolved for another package
+                resources = cached[1]
+                continue
+
             if resources_response.status_code != 200:
-                error_data = resources_response.json() if resources_response.text else {}
+                error_data = _loads(resources_response)
                 error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                return {
-                    "status": "error",
-                    "step": "get_resource_id",
-                    "message": f"Failed to retrieve resource from catalog: {error_message}",
-                    "statusCode": resources_response.status_code,
-                    "correlationId": correlation_id
-                }
-            
-            resources_data = resources_response.json()
-            resources = resources_data.get("value", [])
-            
-            if not resources:
-                return {
-                    "status": "error",
-                    "step": "get_resource_id",
-                    "message": f"Group resource {groupObjectId} not found in catalog {catalogId}",
-                    "correlationId": correlation_id
-                }
-            
-            resource_id = resources[0]["id"]
-            logger.info(f"✅ Step 2 completed: Found resource ID: {resource_id}")
-            
-            # Step 3: Link the Group Resource Role to the Access Package
-            logger.info(f"Step 3: Linking group resource role to access package {accessPackageId}")
-            
-            role_scope_url = f"https://graph.microsoft.com/v1.0/identityGovernance/entitlementManagement/accessPackages/{accessPackageId}/accessPackageResourceRoleScopes"
-            role_scope_payload = {
-                "role": {
-                    "originId": f"Member_{groupObjectId}",
-                    "displayName": "Member",
-                    "originSystem": "AadGroup",
-                    "resource": {
-                        "id": resource_id,
-                        "resourceType": "Security Group",
-                        "originId": groupObjectId,
-                        "originSystem": "AadGroup"
-                    }
-                },
-                "scope": {
+
+                return _err(
+                    f"Failed to retrieve resource from catalog: {error_message}",
+                    step="get_resource_id",
+                    status_code=resources_response.status_code,
+                    correlation_id=correlation_id,
+                )
+
+            resources = _loads(resources_response).get("value", [])
+            resources_etag = resources_response.headers.get("ETag")
+            if resources_etag and resources:
+                _etag_cache[resources_key] = (resources_etag, resources, None)
+
+        if not resources:
+            return _err(
+                f"Group resource {groupObjectId} not found in catalog {catalogId}",
+                step="get_resource_id",
+                correlation_id=correlation_id,
+            )
+
+        resource_id = resources[0]["id"]
+        logger.info(f"✅ Step 2 completed: Found resource ID: {resource_id}")
+
+        # Step 3: Link the Group Resource Role to the Access Package
+        logger.info(f"Step 3: Linking group resource role to access package {accessPackageId}")
+
+        role_scope_url = f"{_IGA_BASE}/accessPackages/{accessPackageId}/accessPackageResourceRoleScopes"
+        role_scope_payload = {
+            "role": {
+                "originId": f"Member_{groupObjectId}",
+                "displayName": "Member",
+                "originSystem": "AadGroup",
+                "resource": {
+                    "id": resource_id,
+                    "resourceType": "Security Group",
                     "originId": groupObjectId,
                     "originSystem": "AadGroup"
                 }
+            },
+            "scope": {
+                "originId": groupObjectId,
+                "originSystem": "AadGroup"
             }
-            
-            role_response = await client.post(role_scope_url, headers=headers, json=role_scope_payload, timeout=60.0)
-            
-            if role_response.status_code == 201:
-                role_scope_data = role_response.json()
-                logger.info(f"✅ Step 3 completed: Group role linked successfully")
-                
-                return {
-                    "status": "success",
-                    "message": "✅ Group resource has been successfully added to access package",
-                    "data": {
-                        "catalogId": catalogId,
-                        "accessPackageId": accessPackageId,
-                        "groupObjectId": groupObjectId,
-                        "resourceId": resource_id,
-                        "roleId": role_scope_data.get("id"),
-                        "role": "Member"
-                    },
-                    "correlationId": correlation_id
-                }
-            elif role_response.status_code == 409:
-                logger.info(f"ℹ️ Step 3: Group role already assigned")
-                
-                return {
-                    "status": "success",
-                    "message": "✅ Group resource is already assigned to access package",
-                    "data": {
-                        "catalogId": catalogId,
-                        "accessPackageId": accessPackageId,
-                        "groupObjectId": groupObjectId,
-                        "resourceId": resource_id,
-                        "role": "Member"
-                    },
-                    "correlationId": correlation_id
-                }
-            else:
-                error_data = role_response.json() if response.text else {}
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                
-                return {
-                    "status": "error",
-                    "step": "link_role_to_package",
-                    "message": f"Failed to link group role: {error_message}",
-                    "statusCode": role_response.status_code,
-                    "correlationId": correlation_id
-                }
+        }
+
+        role_response = await client.post(role_scope_url, headers=headers, content=_json_content(role_scope_payload))
+
+        if role_response.status_code == 201:
+            role_scope_data = _loads(role_response)
+            logger.info(f"✅ Step 3 completed: Group role linked successfully")
+
+            return {
+                "status": "success",
+                "message": "✅ Group resource has been successfully added to access package",
+                "data": {
+                    "catalogId": catalogId,
+                    "accessPackageId": accessPackageId,
+                    "groupObjectId": groupObjectId,
+                    "resourceId": resource_id,
+                    "roleId": role_scope_data.get("id"),
+                    "role": "Member"
+                },
+                "correlationId": correlation_id
+            }
+        elif role_response.status_code == 409:
+            logger.info(f"ℹ️ Step 3: Group role already assigned")
+
+            return {
+                "status": "success",
+                "message": "✅ Group resource is already assigned to access package",
+                "data": {
+                    "catalogId": catalogId,
+                    "accessPackageId": accessPackageId,
+                    "groupObjectId": groupObjectId,
+                    "resourceId": resource_id,
+                    "role": "Member"
+                },
+                "correlationId": correlation_id
+            }
+        else:
+            error_data = _loads(role_response)
+            error_message = error_data.get("error", {}).get("message", "Unknown error")
+
+            return _err(
+                f"Failed to link group role: {error_message}",
+                step="link_role_to_package",
+                status_code=role_response.status_code,
+                correlation_id=correlation_id,
+            )
         
     except Exception as error:
         logger.error(f"Error adding group resource: {error}")
-        return {"status": "error", "message": f"Error adding group resource: {str(error)}"}
+        return _err(f"Error adding group resource: {str(error)}")
 
 
-# Import asyncio for sleep
-import asyncio
+async def IGA_addResourceGroupsToPackage(
+    catalogId: str,
+    accessPackageId: str,
+    groupObjectIds: list[str]
+) -> dict[str, Any]:
+    """
+    Adds multiple Microsoft Entra groups as resources to an access package.
+
+    Runs the per-group add workflow concurrently (at most 20 in flight,
+    to respect Graph throttling) instead of one sequential three-step
+    chain per group, so N groups cost roughly one chain of latency.
+
+    Args:
+        catalogId: The Entra access catalog ID (required)
+        accessPackageId: The ID of the access package (required)
+        groupObjectIds: Azure AD Object IDs of the groups to add (required)
+
+    Returns:
+        Dictionary with per-group results and added/failed counts.
+    """
+    logger.info(f"IGA_addResourceGroupsToPackage called: {len(groupObjectIds) if groupObjectIds else 0} groups")
+
+    # Input validation
+    if not groupObjectIds or not isinstance(groupObjectIds, list):
+        return _err("groupObjectIds is required and must be a non-empty list")
+
+    sem = asyncio.Semaphore(20)
+
+    async def _add_one(group_object_id: str) -> dict[str, Any]:
+        async with sem:
+            return await IGA_addResourceGrouptoPackage(catalogId, accessPackageId, group_object_id)
+
+    outcomes = await asyncio.gather(
+        *(_add_one(group_object_id) for group_object_id in groupObjectIds),
+        return_exceptions=True,
+    )
+
+    results = []
+    succeeded = 0
+    for group_object_id, outcome in zip(groupObjectIds, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = _err(str(outcome))
+        if outcome.get("status") == "success":
+            succeeded += 1
+        results.append({"groupObjectId": group_object_id, **outcome})
+
+    failed = len(groupObjectIds) - succeeded
+    return {
+        "status": "success" if failed == 0 else ("partial" if succeeded else "error"),
+        "message": f"Added {succeeded}/{len(groupObjectIds)} groups to access package",
+        "results": results,
+        "succeeded": succeeded,
+        "failed": failed
+    }
+
@@ -6,14 +6,19 @@ This module defines the MCP tool schemas for the POC service.
 
 from mcp.types import Tool
 
+# Tool schemas are static; build each pydantic Tool once at import
+# time so the getters hand back a shared constant
+
+_GovernInternetAccessPOC_TOOL = Tool(
+    name="GovernInternetAccessPOC",
+    description="Creates an Internet Access governance user group, access catalog, and access package for the POC workflow. Automatically initializes a complete 'Internet Access Governance' flow for POC users with retry logic and async operation support.",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+)
+
 def get_GovernInternetAccessPOC_tool() -> Tool:
     """Get the MCP Tool definition for GovernInternetAccessPOC."""
-    return Tool(
-        name="GovernInternetAccessPOC",
-        description="Creates an Internet Access governance user group, access catalog, and access package for the POC workflow. Automatically initializes a complete 'Internet Access Governance' flow for POC users with retry logic and async operation support.",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
-    )
+    return _GovernInternetAccessPOC_TOOL
@@ -33,14 +33,23 @@ class TestAuthConfig:
         assert config.scopes == ["https://graph.microsoft.com/.default"]
         assert config.authority == "https://login.microsoftonline.com/test-tenant"
     
-    def test_auth_config_validation_disabled(self):
-        """Test validation when auth is disabled."""
+    def test_auth_config_validation_strict(self):
+        """Test that validation is strict regardless of enable_auth."""
         config = AuthConfig(
             tenant_id="test",
             client_id="test",
+            client_secret="test-secret",
             enable_auth=False
         )
         assert config.validate() is True
+
+        incomplete = AuthConfig(
+            tenant_id="test",
+            client_id="test",
+            enable_auth=False
+        )
+        with pytest.raises(ValueError, match="client_secret is required"):
+            incomplete.validate()
     
     def test_auth_config_validation_enabled_missing_secret(self):
         """Test validation fails when secret is missing in application mode."""